@@ -0,0 +1,138 @@
+"""Накопительные итоги тренировок по спортсменам и типам тренировок."""
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from batch import BatchResult
+from homework import InfoMessage
+
+Key = Tuple[str, str]
+
+
+class Totals:
+    """Итоги по одному ключу: число занятий и суммы показателей."""
+
+    __slots__ = ('sessions', 'duration', 'distance', 'speed', 'calories')
+
+    def __init__(self,
+                 sessions: int = 0,
+                 duration: float = 0.0,
+                 distance: float = 0.0,
+                 speed: float = 0.0,
+                 calories: float = 0.0) -> None:
+        self.sessions = sessions
+        self.duration = duration
+        self.distance = distance
+        self.speed = speed
+        self.calories = calories
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Totals):
+            return NotImplemented
+        return self.as_list() == other.as_list()
+
+    def __repr__(self) -> str:
+        return (f'Totals(sessions={self.sessions}, '
+                f'distance={self.distance}, calories={self.calories})')
+
+    @property
+    def mean_speed(self) -> float:
+        """Средняя скорость по занятиям."""
+        return self.speed / self.sessions if self.sessions else 0.0
+
+    def add(self, info: InfoMessage) -> None:
+        """Учесть одно занятие."""
+        self.sessions += 1
+        self.duration += info.duration
+        self.distance += info.distance
+        self.speed += info.speed
+        self.calories += info.calories
+
+    def merge(self, other: 'Totals') -> None:
+        """Прибавить итоги другого накопителя."""
+        self.sessions += other.sessions
+        self.duration += other.duration
+        self.distance += other.distance
+        self.speed += other.speed
+        self.calories += other.calories
+
+    def as_list(self) -> List[float]:
+        """Значения накопителя в порядке аргументов конструктора."""
+        return [self.sessions, self.duration, self.distance,
+                self.speed, self.calories]
+
+
+class Aggregator:
+    """Итоги по ключу `(спортсмен, тип тренировки)` с обновлением за O(1)."""
+
+    def __init__(self) -> None:
+        self.totals: Dict[Key, Totals] = {}
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+    def __iter__(self) -> Iterator[Tuple[Key, Totals]]:
+        return iter(self.totals.items())
+
+    def _totals(self, key: Key) -> Totals:
+        totals = self.totals.get(key)
+        if totals is None:
+            totals = self.totals[key] = Totals()
+        return totals
+
+    def add(self, athlete: str, info: InfoMessage) -> None:
+        """Учесть занятие спортсмена."""
+        self._totals((athlete, info.training_type)).add(info)
+
+    def add_many(self, records: Iterable[Tuple[str, InfoMessage]]) -> None:
+        """Учесть поток пар `(спортсмен, сообщение)`."""
+        for athlete, info in records:
+            self.add(athlete, info)
+
+    def add_batch(self, athletes: Iterable[str], result: BatchResult) -> None:
+        """Учесть результаты пакетного расчёта построчно по спортсменам."""
+        for athlete, info in zip(athletes, result.messages()):
+            self.add(athlete, info)
+
+    def merge(self, other: 'Aggregator') -> None:
+        """Прибавить частичные итоги, например, с другого шарда."""
+        for key, totals in other.totals.items():
+            self._totals(key).merge(totals)
+
+    def get(self, athlete: str,
+            training_type: Optional[str] = None) -> Totals:
+        """Итоги спортсмена по типу тренировки или по всем типам."""
+        if training_type is not None:
+            return self.totals.get((athlete, training_type), Totals())
+        result = Totals()
+        for (name, _), totals in self.totals.items():
+            if name == athlete:
+                result.merge(totals)
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Состояние в виде, пригодном для JSON."""
+        return {'version': 1,
+                'totals': [[athlete, training_type, *totals.as_list()]
+                           for (athlete, training_type), totals
+                           in self.totals.items()]}
+
+    @classmethod
+    def restore(cls, snapshot: Dict[str, Any]) -> 'Aggregator':
+        """Восстановить накопитель из `snapshot()`."""
+        if snapshot.get('version') != 1:
+            raise ValueError('Неподдерживаемая версия снимка')
+        aggregator = cls()
+        for athlete, training_type, *values in snapshot['totals']:
+            aggregator.totals[(athlete, training_type)] = Totals(*values)
+        return aggregator
+
+    def save(self, path: str) -> None:
+        """Сохранить снимок в файл."""
+        with open(path, 'w', encoding='utf-8') as stream:
+            json.dump(self.snapshot(), stream, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> 'Aggregator':
+        """Загрузить снимок из файла."""
+        with open(path, encoding='utf-8') as stream:
+            return cls.restore(json.load(stream))
@@ -0,0 +1,275 @@
+"""Колоночный (пакетный) расчёт показателей тренировок."""
+import math
+from array import array
+from dataclasses import dataclass
+from typing import (Callable, Dict, Iterable, Iterator, List, Mapping,
+                    Sequence, Tuple)
+
+from homework import InfoMessage, Running, SportsWalking, Swimming
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy необязателен
+    np = None
+
+Column = Sequence[float]
+Columns = Mapping[str, Column]
+
+BATCH_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    'SWM': ('action', 'duration', 'weight', 'length_pool', 'count_pool'),
+    'RUN': ('action', 'duration', 'weight'),
+    'WLK': ('action', 'duration', 'weight', 'height'),
+}
+# Причины, по которым строку нельзя рассчитать, по убыванию приоритета.
+REJECT_REASONS = ('not_finite', 'zero_duration', 'zero_height')
+
+
+# Формулы — собранные `compile_kernel` функции классов: те же операции в
+# том же порядке, поэтому они работают и со скалярами, и с массивами numpy.
+BATCH_FORMULAS: Dict[str, Tuple[str, Callable]] = {
+    'SWM': (Swimming.__name__, Swimming.KERNEL),
+    'RUN': (Running.__name__, Running.KERNEL),
+    'WLK': (SportsWalking.__name__, SportsWalking.KERNEL),
+}
+
+
+def _floats(column: Column) -> List[float]:
+    """Колонка как список `float`; `tolist` у массивов заметно быстрее."""
+    if hasattr(column, 'tolist'):
+        return column.tolist()
+    return [float(value) for value in column]
+
+
+@dataclass
+class BatchResult:
+    """Результаты расчёта для пакета тренировок одного типа."""
+
+    training_type: str
+    duration: Column
+    distance: Column
+    speed: Column
+    calories: Column
+
+    def __len__(self) -> int:
+        return len(self.duration)
+
+    def messages(self) -> Iterator[InfoMessage]:
+        """Построчно вернуть результаты в виде `InfoMessage`."""
+        training_type = self.training_type
+        for row in zip(*map(_floats, (self.duration, self.distance,
+                                      self.speed, self.calories))):
+            yield InfoMessage(training_type, *row)
+
+
+class TrainingView:
+    """Тренировка из `TrainingColumns` без отдельного объекта-хранилища."""
+
+    __slots__ = ('_columns', '_index')
+
+    def __init__(self, columns: 'TrainingColumns', index: int) -> None:
+        self._columns = columns
+        self._index = index
+
+    def values(self) -> Tuple[float, ...]:
+        """Вернуть исходные данные пакета."""
+        return tuple(column[self._index]
+                     for column in self._columns.columns.values())
+
+    def _metrics(self) -> Tuple[float, float, float]:
+        _, formula = BATCH_FORMULAS[self._columns.workout_type]
+        return formula(*self.values())
+
+    def get_distance(self) -> float:
+        """Получить дистанцию в км."""
+        return self._metrics()[0]
+
+    def get_mean_speed(self) -> float:
+        """Получить среднюю скорость движения."""
+        return self._metrics()[1]
+
+    def get_spent_calories(self) -> float:
+        """Получить количество затраченных калорий."""
+        return self._metrics()[2]
+
+    def show_training_info(self) -> InfoMessage:
+        """Вернуть информационное сообщение о выполненной тренировке."""
+        training_type, _ = BATCH_FORMULAS[self._columns.workout_type]
+        duration = self._columns.columns['duration'][self._index]
+        return InfoMessage(training_type, duration, *self._metrics())
+
+
+class TrainingColumns:
+    """Тренировки одного типа, хранящиеся в типизированных колонках."""
+
+    __slots__ = ('workout_type', 'columns')
+
+    def __init__(self, workout_type: str) -> None:
+        if workout_type not in BATCH_COLUMNS:
+            raise ValueError('Неверный ключ')
+        self.workout_type = workout_type
+        self.columns: Dict[str, array] = {
+            name: array('d') for name in BATCH_COLUMNS[workout_type]}
+
+    def __len__(self) -> int:
+        return len(self.columns['action'])
+
+    def __getitem__(self, index: int) -> TrainingView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Индекс тренировки вне диапазона')
+        return TrainingView(self, index)
+
+    def __iter__(self) -> Iterator[TrainingView]:
+        return (TrainingView(self, index) for index in range(len(self)))
+
+    def append(self, data: Sequence[float]) -> None:
+        """Добавить данные одного пакета."""
+        if len(data) != len(self.columns):
+            raise ValueError(f'Пакет {self.workout_type} должен содержать '
+                             f'{len(self.columns)} значений, '
+                             f'получено {len(data)}')
+        for column, value in zip(self.columns.values(), data):
+            column.append(value)
+
+    def extend(self, packages: Iterable[Sequence[float]]) -> None:
+        """Добавить данные нескольких пакетов."""
+        for data in packages:
+            self.append(data)
+
+    def calculate(self) -> BatchResult:
+        """Рассчитать показатели всех тренировок пакетом."""
+        return calculate_batch(self.workout_type, self.columns)
+
+
+def _columns_for(workout_type: str, columns: Columns) -> List[Column]:
+    """Проверить набор колонок и вернуть их в порядке аргументов."""
+    if workout_type not in BATCH_COLUMNS:
+        raise ValueError('Неверный ключ')
+    names = BATCH_COLUMNS[workout_type]
+    missing = [name for name in names if name not in columns]
+    if missing:
+        raise ValueError(f'Нет колонок для {workout_type}: '
+                         f'{", ".join(missing)}')
+    result = [columns[name] for name in names]
+    if len({len(column) for column in result}) > 1:
+        raise ValueError(f'Колонки {workout_type} разной длины')
+    return result
+
+
+def _calculate_python(formula: Callable, values: List[Column]):
+    """Расчёт без numpy: та же формула, применённая к каждой строке."""
+    rows = [formula(*row) for row in zip(*values)]
+    durations = array('d', values[1])
+    if not rows:
+        return durations, array('d'), array('d'), array('d')
+    return (durations, *(array('d', column) for column in zip(*rows)))
+
+
+def _calculate_numpy(formula: Callable, values: List[Column]):
+    """Векторизованный расчёт средствами numpy.
+
+    При делении на ноль, переполнении или недопустимой операции пакет
+    пересчитывается построчно: так поднимается то же исключение, что и
+    у методов (`ZeroDivisionError`, `OverflowError` у степени), а где
+    Python исключений не поднимает (переполнение умножения), получаются
+    те же значения.
+    """
+    arrays = [np.asarray(column, dtype=np.float64) for column in values]
+    with np.errstate(divide='raise', over='raise', invalid='raise'):
+        try:
+            return (arrays[1], *formula(*arrays))
+        except FloatingPointError:
+            pass
+    return tuple(np.asarray(column)
+                 for column in _calculate_python(formula, values))
+
+
+def calculate_batch(workout_type: str, columns: Columns) -> BatchResult:
+    """Рассчитать дистанцию, скорость и калории для колонок одного типа."""
+    values = _columns_for(workout_type, columns)
+    training_type, formula = BATCH_FORMULAS[workout_type]
+    if np is not None:
+        return BatchResult(training_type,
+                           *_calculate_numpy(formula, values))
+    return BatchResult(training_type, *_calculate_python(formula, values))
+
+
+def calculate_batches(batches: Mapping[str, Columns]
+                      ) -> Dict[str, BatchResult]:
+    """Рассчитать пакеты, сгруппированные по коду тренировки."""
+    return {workout_type: calculate_batch(workout_type, columns)
+            for workout_type, columns in batches.items()}
+
+
+def group_packages(packages: Iterable[Tuple[str, Sequence[int]]]
+                   ) -> Dict[str, Dict[str, List[int]]]:
+    """Разложить пакеты `(код, данные)` по колонкам для каждого типа."""
+    batches: Dict[str, Dict[str, List[int]]] = {}
+    for workout_type, data in packages:
+        if workout_type not in BATCH_COLUMNS:
+            raise ValueError('Неверный ключ')
+        names = BATCH_COLUMNS[workout_type]
+        if len(data) != len(names):
+            raise ValueError(f'Пакет {workout_type} должен содержать '
+                             f'{len(names)} значений, получено {len(data)}')
+        columns = batches.setdefault(
+            workout_type, {name: [] for name in names})
+        for name, value in zip(names, data):
+            columns[name].append(value)
+    return batches
+
+
+def _invalid_numpy(names: Sequence[str], values: List[Column]
+                   ) -> Dict[int, str]:
+    arrays = dict(zip(names, (np.asarray(column, dtype=np.float64)
+                              for column in values)))
+    checks = {'not_finite': ~np.isfinite(np.vstack(list(arrays.values())))
+              .all(axis=0),
+              'zero_duration': arrays['duration'] == 0}
+    if 'height' in arrays:
+        checks['zero_height'] = arrays['height'] == 0
+    reasons: Dict[int, str] = {}
+    for reason in reversed(REJECT_REASONS):
+        if reason in checks:
+            reasons.update(dict.fromkeys(
+                np.flatnonzero(checks[reason]).tolist(), reason))
+    return reasons
+
+
+def _invalid_python(names: Sequence[str], values: List[Column]
+                    ) -> Dict[int, str]:
+    duration = names.index('duration')
+    height = names.index('height') if 'height' in names else None
+    reasons: Dict[int, str] = {}
+    for row, data in enumerate(zip(*values)):
+        if not all(map(math.isfinite, data)):
+            reasons[row] = 'not_finite'
+        elif data[duration] == 0:
+            reasons[row] = 'zero_duration'
+        elif height is not None and data[height] == 0:
+            reasons[row] = 'zero_height'
+    return reasons
+
+
+def invalid_rows(workout_type: str, columns: Columns) -> Dict[int, str]:
+    """Номера строк, которые нельзя рассчитать, и причины из `REJECT_REASONS`.
+
+    Нулевые длительность или рост привели бы к делению на ноль, а
+    бесконечности и NaN — к бессмысленным показателям.
+    """
+    values = _columns_for(workout_type, columns)
+    names = BATCH_COLUMNS[workout_type]
+    if np is not None:
+        return _invalid_numpy(names, values)
+    return _invalid_python(names, values)
+
+
+def select_rows(columns: Columns, rows: Sequence[int]) -> Dict[str, Column]:
+    """Оставить в колонках только строки с номерами `rows`."""
+    if np is not None:
+        index = np.asarray(rows, dtype=np.intp)
+        return {name: np.asarray(column, dtype=np.float64)[index]
+                for name, column in columns.items()}
+    return {name: [column[row] for row in rows]
+            for name, column in columns.items()}
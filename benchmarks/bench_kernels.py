@@ -0,0 +1,56 @@
+"""Методы показателей против собранных функций по типам.
+
+`_metrics` — то, через что считает `show_training_info()`; `KERNEL` —
+позиционная функция для `batch.py`.
+
+Запуск из корня проекта: python -m benchmarks.bench_kernels [N]
+"""
+import sys
+import time
+from typing import Callable, List
+
+from benchmarks.workload import synthetic_backlog
+from homework import Training, read_package
+
+
+def by_methods(training: Training) -> tuple:
+    return (training.get_distance(),
+            training.get_mean_speed(),
+            training.get_spent_calories())
+
+
+def by_bound(training: Training) -> tuple:
+    return training._metrics()
+
+
+def by_kernel(training: Training) -> tuple:
+    return training.KERNEL(*training.read_inputs(training))
+
+
+def elapsed(operation: Callable[[Training], tuple],
+            trainings: List[Training]) -> float:
+    start = time.perf_counter()
+    for training in trainings:
+        operation(training)
+    return time.perf_counter() - start
+
+
+def main(count: int) -> None:
+    print(f'N = {count}')
+    for workout_type in ('RUN', 'WLK', 'SWM'):
+        trainings = [read_package(*package) for package in
+                     synthetic_backlog(count, {workout_type: 1.0})]
+        assert all(by_methods(training) == by_bound(training)
+                   == by_kernel(training) for training in trainings)
+        methods = elapsed(by_methods, trainings)
+        bound = elapsed(by_bound, trainings)
+        kernel = elapsed(by_kernel, trainings)
+        print(f'{workout_type}: методы {count / methods / 1e6:.2f} млн/с, '
+              f'_metrics {count / bound / 1e6:.2f} млн/с '
+              f'(x{methods / bound:.2f}), '
+              f'KERNEL {count / kernel / 1e6:.2f} млн/с '
+              f'(x{methods / kernel:.2f})')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,69 @@
+"""Замер памяти на одну запись: объекты против колоночного хранения.
+
+Запуск из корня проекта: python -m benchmarks.bench_memory [N]
+"""
+import sys
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from typing import Callable
+
+from batch import TrainingColumns
+from homework import InfoMessage, read_package
+
+PACKAGES = {
+    'SWM': [720, 1, 80, 25, 40],
+    'RUN': [15000, 1, 75],
+    'WLK': [9000, 1, 75, 180],
+}
+
+# InfoMessage в том виде, в каком он был до перехода на __slots__.
+DictInfoMessage = make_dataclass(
+    'DictInfoMessage',
+    [(field.name, field.type) for field in fields(InfoMessage)])
+
+
+def bytes_per_record(build: Callable[[int], object], count: int) -> float:
+    """Измерить прирост памяти на одну запись при построении `count`."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    keep = build(count)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return (after - before) / count
+
+
+def build_trainings(workout_type: str) -> Callable[[int], object]:
+    data = PACKAGES[workout_type]
+    return lambda count: [read_package(workout_type, [*data])
+                          for _ in range(count)]
+
+
+def build_columns(workout_type: str) -> Callable[[int], object]:
+    def build(count: int) -> TrainingColumns:
+        columns = TrainingColumns(workout_type)
+        columns.extend(PACKAGES[workout_type] for _ in range(count))
+        return columns
+    return build
+
+
+def build_messages(message_class: type) -> Callable[[int], object]:
+    return lambda count: [message_class('Running', float(i), 1.5, 2.5, 3.5)
+                          for i in range(count)]
+
+
+def main(count: int) -> None:
+    print(f'N = {count}')
+    for workout_type in PACKAGES:
+        objects = bytes_per_record(build_trainings(workout_type), count)
+        columns = bytes_per_record(build_columns(workout_type), count)
+        print(f'{workout_type}: Training {objects:8.1f} Б/запись, '
+              f'TrainingColumns {columns:8.1f} Б/запись')
+    before = bytes_per_record(build_messages(DictInfoMessage), count)
+    after = bytes_per_record(build_messages(InfoMessage), count)
+    print(f'InfoMessage: без __slots__ {before:8.1f} Б/запись, '
+          f'с __slots__ {after:8.1f} Б/запись')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,83 @@
+"""Число вычислений показателей с кэшем и без него.
+
+Запуск из корня проекта: python -m benchmarks.bench_metrics_cache [N]
+"""
+import sys
+import time
+from collections import Counter
+from typing import Callable, Dict
+
+from homework import Running, SportsWalking, Swimming, Training, read_package
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+def count_calls(calls: Counter) -> Dict[type, Dict[str, Callable]]:
+    """Подменить методы показателей счётчиками, вернуть исходные."""
+    originals: Dict[type, Dict[str, Callable]] = {}
+    for cls in (Training, Running, SportsWalking, Swimming):
+        originals[cls] = {}
+        for name in Training.METRICS:
+            if name not in vars(cls):
+                continue
+            method = vars(cls)[name]
+            originals[cls][name] = method
+
+            def counted(self, method=method, name=name):
+                calls[name] += 1
+                return method(self)
+            setattr(cls, name, counted)
+    return originals
+
+
+def query(training: Training) -> None:
+    """Запросить все показатели тренировки через её методы."""
+    training.get_distance()
+    training.get_mean_speed()
+    training.get_spent_calories()
+
+
+def run(queries: int, cached: bool) -> Counter:
+    calls: Counter = Counter()
+    originals = count_calls(calls)
+    try:
+        for package in PACKAGES:
+            training = read_package(*package)
+            if cached:
+                training.enable_metrics_cache()
+            for _ in range(queries):
+                query(training)
+    finally:
+        for cls, methods in originals.items():
+            for name, method in methods.items():
+                setattr(cls, name, method)
+    return calls
+
+
+def timing(queries: int, cached: bool) -> float:
+    training = read_package(*PACKAGES[1])
+    if cached:
+        training.enable_metrics_cache()
+    start = time.perf_counter()
+    for _ in range(queries):
+        query(training)
+    return time.perf_counter() - start
+
+
+def main(queries: int) -> None:
+    print(f'{queries} запросов показателей на каждую тренировку')
+    for cached in (False, True):
+        calls = run(queries, cached)
+        label = 'с кэшем' if cached else 'без кэша'
+        counts = ', '.join(f'{name}={calls[name]}'
+                           for name in Training.METRICS)
+        print(f'{label}: {counts}; '
+              f'Running: {timing(queries, cached):.3f} с')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,35 @@
+"""Масштабирование `parallel.process_packages` по числу процессов.
+
+Запуск из корня проекта:
+python -m benchmarks.bench_parallel [N] [размер части]
+"""
+import sys
+import time
+
+from benchmarks.workload import synthetic_backlog
+from parallel import process_packages
+
+WORKERS = (1, 2, 4, 8)
+
+
+def main(count: int, chunk_size: int) -> None:
+    packages = synthetic_backlog(count)
+    baseline = None
+    print(f'N = {count}, chunk_size = {chunk_size}')
+    for workers in WORKERS:
+        start = time.perf_counter()
+        for _ in process_packages(packages,
+                                  workers=workers,
+                                  chunk_size=chunk_size,
+                                  formatted=True):
+            pass
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f'workers={workers}: {elapsed:7.3f} с, '
+              f'{count / elapsed:12,.0f} пакетов/с, '
+              f'ускорение x{baseline / elapsed:.2f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 5000)
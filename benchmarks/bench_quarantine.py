@@ -0,0 +1,55 @@
+"""Пакетная обработка с карантином против построчного расчёта.
+
+Запуск из корня проекта: python -m benchmarks.bench_quarantine [N]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import quarantine
+from homework import iter_lines, stream_reports
+from synthetic import SyntheticWorkload, WorkloadProfile
+
+
+def write_input(path: str, count: int, malformed_rate: float) -> int:
+    workload = SyntheticWorkload(WorkloadProfile(
+        malformed_rate=malformed_rate))
+    with open(path, 'w', encoding='utf-8') as stream:
+        return workload.write_text(stream, count)
+
+
+def per_record(path: str, output: str) -> None:
+    with open(output, 'w', encoding='utf-8') as stream:
+        for report in stream_reports(iter_lines(path)):
+            stream.write(report + '\n')
+
+
+def main(count: int) -> None:
+    print(f'N = {count}')
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'in.txt')
+        output = os.path.join(directory, 'out.txt')
+        bad = os.path.join(directory, 'bad.jsonl')
+        checkpoint = os.path.join(directory, 'run.ckpt')
+        for malformed_rate in (0.0, 0.01):
+            size = write_input(source, count, malformed_rate)
+            runs = {'карантин': lambda: quarantine.process_file(
+                source, output, bad)}
+            runs['карантин + точка'] = lambda: quarantine.process_file(
+                source, output, bad, checkpoint)
+            if not malformed_rate:
+                runs['построчно'] = lambda: per_record(source, output)
+            for label, operation in runs.items():
+                if os.path.exists(checkpoint):
+                    os.remove(checkpoint)
+                start = time.perf_counter()
+                operation()
+                elapsed = time.perf_counter() - start
+                print(f'испорчено {malformed_rate:4.0%}, {label:17}: '
+                      f'{count / elapsed / 1e6:5.2f} млн пакетов/с, '
+                      f'{size / elapsed / 1e6:6.1f} МБ/с')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,44 @@
+"""Скорость текстового отчёта: `get_message()` против шаблонов по типам.
+
+Запуск из корня проекта: python -m benchmarks.bench_report [N]
+"""
+import io
+import sys
+import time
+from typing import Callable, List
+
+from benchmarks.workload import synthetic_backlog
+from homework import InfoMessage, read_package
+from report import write_reports
+
+
+def by_get_message(infos: List[InfoMessage]) -> str:
+    return ''.join([info.get_message() + '\n' for info in infos])
+
+
+def by_report(workers: int) -> Callable[[List[InfoMessage]], str]:
+    def render(infos: List[InfoMessage]) -> str:
+        buffer = io.StringIO()
+        write_reports(infos, buffer, workers=workers)
+        return buffer.getvalue()
+    return render
+
+
+def main(count: int) -> None:
+    infos = [read_package(*package).show_training_info()
+             for package in synthetic_backlog(count)]
+    variants = [('get_message()', by_get_message)] + [
+        (f'шаблоны, потоков: {workers}', by_report(workers))
+        for workers in (1, 2, 4)]
+    expected = by_get_message(infos)
+    print(f'N = {count}')
+    for name, render in variants:
+        start = time.perf_counter()
+        text = render(infos)
+        elapsed = time.perf_counter() - start
+        assert text == expected
+        print(f'{name:20}: {count / elapsed / 1e6:5.2f} млн сообщений/с')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300_000)
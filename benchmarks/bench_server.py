@@ -0,0 +1,53 @@
+"""Задержка и пропускная способность `server.IngestServer`.
+
+Сервер и клиенты работают в одном процессе. Каждый клиент держит своё
+соединение и отправляет пакеты по одному, дожидаясь ответа.
+
+Запуск из корня проекта:
+python -m benchmarks.bench_server [соединений] [запросов на соединение]
+"""
+import asyncio
+import statistics
+import sys
+import time
+from typing import List
+
+from server import IngestServer
+
+PAYLOADS = (b'SWM,720,1,80,25,40\n',
+            b'RUN,15000,1,75\n',
+            b'WLK,9000,1,75,180\n')
+
+
+async def client(port: int, requests: int, latencies: List[float]) -> None:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    for index in range(requests):
+        start = time.perf_counter()
+        writer.write(PAYLOADS[index % len(PAYLOADS)])
+        await reader.readline()
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(connections: int, requests: int) -> None:
+    ingest = IngestServer()
+    server = await ingest.start_tcp(backlog=connections)
+    port = server.sockets[0].getsockname()[1]
+    latencies: List[float] = []
+    async with server:
+        start = time.perf_counter()
+        await asyncio.gather(*(client(port, requests, latencies)
+                               for _ in range(connections)))
+        elapsed = time.perf_counter() - start
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f'соединений: {connections}, запросов: {len(latencies)}')
+    print(f'пропускная способность: {len(latencies) / elapsed:,.0f} '
+          f'пакетов/с за {elapsed:.2f} с')
+    print(f'задержка p50: {quantiles[49] * 1000:.2f} мс, '
+          f'p99: {quantiles[98] * 1000:.2f} мс')
+
+
+if __name__ == '__main__':
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+                    int(sys.argv[2]) if len(sys.argv) > 2 else 20))
@@ -0,0 +1,144 @@
+"""Передача рассчитанных тренировок читателям: каналы против общей памяти.
+
+Пишущий процесс отправляет готовые `InfoMessage` каждому читателю, а
+читатели суммируют калории. Каналы (`Pipe`) передают pickle по одному
+сообщению и списками по `BATCH`; `SharedRing` — записи в общей памяти,
+которые читаются колонками или собираются обратно в `InfoMessage`.
+
+Запуск из корня проекта:
+python -m benchmarks.bench_shared_ring [N] [читателей]
+"""
+import multiprocessing
+import sys
+import time
+from typing import Callable, List
+
+from benchmarks.workload import synthetic_backlog
+from homework import InfoMessage, read_package
+from shared_ring import SharedRing, record_columns
+
+BATCH = 1000
+
+
+def pipe_reader(connection, barrier, results) -> None:
+    barrier.wait()
+    total = 0.0
+    while True:
+        info = connection.recv()
+        if info is None:
+            break
+        total += info.calories
+    results.put(total)
+
+
+def pipe_batch_reader(connection, barrier, results) -> None:
+    barrier.wait()
+    total = 0.0
+    while True:
+        batch = connection.recv()
+        if batch is None:
+            break
+        total += sum([info.calories for info in batch])
+    results.put(total)
+
+
+def ring_reader(ring: SharedRing, consumer: int, barrier, results) -> None:
+    barrier.wait()
+    total = 0.0
+    for view in ring.batches(consumer):
+        calories = record_columns(view)['calories']
+        total += sum(calories)
+        calories.release()
+    ring.close()
+    results.put(total)
+
+
+def ring_messages_reader(ring: SharedRing, consumer: int, barrier,
+                         results) -> None:
+    barrier.wait()
+    total = 0.0
+    for info in ring.messages(consumer):
+        total += info.calories
+    ring.close()
+    results.put(total)
+
+
+def through_pipes(messages: List[InfoMessage], readers: int,
+                  batch: int) -> float:
+    context = multiprocessing.get_context()
+    barrier = context.Barrier(readers + 1)
+    results = context.SimpleQueue()
+    target = pipe_batch_reader if batch > 1 else pipe_reader
+    connections = []
+    processes = []
+    for _ in range(readers):
+        receiver, sender = context.Pipe(duplex=False)
+        connections.append(sender)
+        processes.append(context.Process(
+            target=target, args=(receiver, barrier, results)))
+    for process in processes:
+        process.start()
+    barrier.wait()
+    start = time.perf_counter()
+    if batch > 1:
+        for index in range(0, len(messages), batch):
+            part = messages[index:index + batch]
+            for connection in connections:
+                connection.send(part)
+    else:
+        for info in messages:
+            for connection in connections:
+                connection.send(info)
+    for connection in connections:
+        connection.send(None)
+    totals = [results.get() for _ in processes]
+    elapsed = time.perf_counter() - start
+    for process in processes:
+        process.join()
+    assert len(set(totals)) == 1
+    return elapsed
+
+
+def through_ring(target: Callable) -> Callable[..., float]:
+    def run(messages: List[InfoMessage], readers: int, batch: int) -> float:
+        context = multiprocessing.get_context()
+        barrier = context.Barrier(readers + 1)
+        results = context.SimpleQueue()
+        with SharedRing(consumers=readers, context=context) as ring:
+            processes = [context.Process(
+                target=target, args=(ring, consumer, barrier, results))
+                for consumer in range(readers)]
+            for process in processes:
+                process.start()
+            barrier.wait()
+            start = time.perf_counter()
+            ring.publish(messages)
+            ring.finish()
+            totals = [results.get() for _ in processes]
+            elapsed = time.perf_counter() - start
+            for process in processes:
+                process.join()
+        assert len(set(totals)) == 1
+        return elapsed
+    return run
+
+
+def main(count: int, readers: int) -> None:
+    messages = [read_package(*package).show_training_info()
+                for package in synthetic_backlog(count)]
+    variants = [
+        ('Pipe, по одному', through_pipes, 1),
+        (f'Pipe, по {BATCH}', through_pipes, BATCH),
+        ('SharedRing, колонки', through_ring(ring_reader), 0),
+        ('SharedRing, InfoMessage', through_ring(ring_messages_reader), 0),
+    ]
+    print(f'N = {count}, читателей: {readers}')
+    for name, run, batch in variants:
+        elapsed = run(messages, readers, batch)
+        print(f'{name:24}: {count / elapsed / 1e6:5.2f} млн сообщений/с '
+              f'на читателя')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 2)
@@ -0,0 +1,54 @@
+"""Время запуска `cli.py` по сравнению с пустым интерпретатором.
+
+Выводит среднее время нескольких запусков и самые медленные импорты
+из отчёта `-X importtime` для простого текстового прогона.
+
+Запуск из корня проекта: python -m benchmarks.bench_startup [повторов]
+"""
+import os
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGES = b'SWM,720,1,80,25,40\nRUN,15000,1,75\nWLK,9000,1,75,180\n'
+COMMANDS = {
+    'python -c pass': [sys.executable, '-c', 'pass'],
+    'import homework': [sys.executable, '-c', 'import homework'],
+    'cli.py': [sys.executable, 'cli.py'],
+}
+
+
+def wall_time(command: List[str], repeats: int) -> float:
+    """Среднее время запуска команды в секундах."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        subprocess.run(command, input=PACKAGES, cwd=ROOT, check=True,
+                       stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - start) / repeats
+
+
+def slowest_imports(limit: int = 10) -> List[Tuple[int, str]]:
+    """Самые долгие импорты (суммарно, мкс) при запуске `cli.py`."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', 'cli.py'],
+                            input=PACKAGES, cwd=ROOT, check=True,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE)
+    imports = []
+    for line in result.stderr.decode().splitlines()[1:]:
+        _, cumulative, name = line.split('|')
+        imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:limit]
+
+
+def main(repeats: int) -> None:
+    for label, command in COMMANDS.items():
+        print(f'{label:16} {wall_time(command, repeats) * 1000:8.1f} мс')
+    print('Самые долгие импорты cli.py (мкс, суммарно):')
+    for cumulative, name in slowest_imports():
+        print(f'{cumulative:10} {name}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,43 @@
+"""Скорость генератора синтетических пакетов по видам вывода.
+
+Запуск из корня проекта: python -m benchmarks.bench_synthetic [N]
+"""
+import io
+import sys
+import time
+from typing import Callable
+
+import synthetic
+
+
+def throughput(produce: Callable[[], int], count: int) -> str:
+    start = time.perf_counter()
+    size = produce()
+    elapsed = time.perf_counter() - start
+    rate = f'{count / elapsed / 1e6:6.2f} млн пакетов/с'
+    if size:
+        rate += f', {size / elapsed / 1e6:7.1f} МБ/с'
+    return rate
+
+
+def consume(workload: synthetic.SyntheticWorkload, count: int) -> int:
+    """Перебрать пакеты в памяти; объём вывода не считается."""
+    for _ in workload.packages(count):
+        pass
+    return 0
+
+
+def main(count: int) -> None:
+    workload = synthetic.SyntheticWorkload(synthetic.WorkloadProfile(
+        duplicate_rate=0.05, malformed_rate=0.01))
+    backend = 'numpy' if synthetic.np is not None else 'без numpy'
+    print(f'N = {count}, сборка по колонкам: {backend}')
+    print('в памяти:  ', throughput(lambda: consume(workload, count), count))
+    print('текст:     ', throughput(
+        lambda: workload.write_text(io.StringIO(), count), count))
+    print('двоичный:  ', throughput(
+        lambda: workload.write_binary(io.BytesIO(), count), count))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,190 @@
+"""Набор замеров горячих путей `homework.py`.
+
+Для каждого замера и размера нагрузки выводятся пропускная способность,
+задержка одной операции p50/p99 и пиковый объём памяти. Задержка
+считается по выборкам из `--sample` операций подряд: отдельные вызовы
+слишком коротки, чтобы мерить их по одному. Пакеты берутся по кругу из
+пула не больше `POOL_LIMIT` штук, поэтому и 10^7 операций не требуют
+10^7 объектов в памяти.
+
+Запуск из корня проекта:
+python -m benchmarks.suite --sizes 1000 100000 --output bench.json
+python -m benchmarks.suite --baseline bench.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from benchmarks.workload import DEFAULT_MIX, parse_mix, synthetic_backlog
+from homework import (InfoMessage, Running, SportsWalking, Swimming,
+                      Training, main, read_package)
+
+POOL_LIMIT = 100_000
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+Prepare = Callable[[List[Tuple[str, list]]], Tuple[Callable, List[Any]]]
+
+
+def _trainings(packages, cls=Training) -> List[Training]:
+    trainings = [read_package(*package) for package in packages]
+    return [training for training in trainings if isinstance(training, cls)]
+
+
+def _calories(cls: type) -> Prepare:
+    return lambda packages: (cls.get_spent_calories,
+                             _trainings(packages, cls))
+
+
+def _main(package) -> None:
+    main(read_package(*package))
+
+
+BENCHMARKS: Dict[str, Prepare] = {
+    'read_package': lambda packages: (lambda package: read_package(*package),
+                                      packages),
+    'calories_Running': _calories(Running),
+    'calories_SportsWalking': _calories(SportsWalking),
+    'calories_Swimming': _calories(Swimming),
+    'show_training_info': lambda packages: (Training.show_training_info,
+                                            _trainings(packages)),
+    'get_message': lambda packages: (
+        InfoMessage.get_message,
+        [training.show_training_info()
+         for training in _trainings(packages)]),
+    'main': lambda packages: (_main, packages),
+}
+
+
+def _timed_samples(operation: Callable, items: Sequence,
+                   count: int, sample: int) -> List[float]:
+    """Выполнить `count` операций по кругу, вернуть время каждой выборки."""
+    samples: List[float] = []
+    position = 0
+    done = 0
+    while done < count:
+        size = min(sample, count - done, len(items))
+        if position + size > len(items):
+            position = 0
+        chunk = items[position:position + size]
+        start = time.perf_counter()
+        for item in chunk:
+            operation(item)
+        samples.append((time.perf_counter() - start) / size)
+        position += size
+        done += size
+    return samples
+
+
+def measure(name: str, count: int, mix: Dict[str, float],
+            seed: int, sample: int) -> Dict[str, float]:
+    """Выполнить один замер для нагрузки из `count` операций."""
+    packages = synthetic_backlog(min(count, POOL_LIMIT), mix, seed)
+    tracemalloc.start()
+    operation, items = BENCHMARKS[name](packages)
+    if items:
+        _timed_samples(operation, items, min(count, sample), sample)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if not items:
+        return {}
+    # Количество операций для типов из части смеси пропорционально доле.
+    count = max(1, count * len(items) // len(packages))
+    start = time.perf_counter()
+    samples = _timed_samples(operation, items, count, sample)
+    elapsed = time.perf_counter() - start
+    if len(samples) > 1:
+        quantiles = statistics.quantiles(samples, n=100)
+    else:
+        quantiles = samples * 99
+    return {'operations': count,
+            'throughput': count / elapsed,
+            'p50_us': quantiles[49] * 1e6,
+            'p99_us': quantiles[98] * 1e6,
+            'peak_kib': peak / 1024}
+
+
+def run(names: Sequence[str], sizes: Sequence[int],
+        mix: Dict[str, float], seed: int, sample: int) -> Dict[str, Any]:
+    """Выполнить замеры и собрать результаты для сохранения в JSON."""
+    results: Dict[str, Dict[str, float]] = {}
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        for name in names:
+            for size in sizes:
+                with contextlib.redirect_stdout(devnull):
+                    result = measure(name, size, mix, seed, sample)
+                if result:
+                    results[f'{name}@{size}'] = result
+                    print(format_result(f'{name}@{size}', result))
+    return {'meta': {'python': platform.python_version(),
+                     'platform': platform.platform(),
+                     'mix': mix,
+                     'seed': seed,
+                     'sample': sample},
+            'results': results}
+
+
+def format_result(key: str, result: Dict[str, float]) -> str:
+    return (f'{key:32} {result["throughput"]:14,.0f} оп/с  '
+            f'p50 {result["p50_us"]:8.3f} мкс  '
+            f'p99 {result["p99_us"]:8.3f} мкс  '
+            f'память {result["peak_kib"]:10,.1f} КиБ')
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            tolerance: float) -> List[str]:
+    """Сравнить с базовым прогоном, вернуть замеры с регрессией."""
+    regressions: List[str] = []
+    for key, result in current['results'].items():
+        base = baseline['results'].get(key)
+        if base is None:
+            continue
+        ratio = result['throughput'] / base['throughput']
+        mark = 'РЕГРЕССИЯ' if ratio < 1 - tolerance else 'ок'
+        print(f'{key:32} x{ratio:6.2f}  {mark}')
+        if ratio < 1 - tolerance:
+            regressions.append(key)
+    return regressions
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=DEFAULT_SIZES,
+                        help='размеры нагрузки, например 1000 10000000')
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help='доли типов, например RUN=2,WLK=1,SWM=1')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS),
+                        default=list(BENCHMARKS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--sample', type=int, default=1000,
+                        help='операций в одной выборке задержки')
+    parser.add_argument('--output', help='куда сохранить результаты JSON')
+    parser.add_argument('--baseline', help='JSON базового прогона')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='допустимое падение пропускной способности')
+    return parser.parse_args(argv)
+
+
+def cli(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    current = run(args.only, args.sizes, args.mix, args.seed, args.sample)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as stream:
+            json.dump(current, stream, ensure_ascii=False, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as stream:
+            baseline = json.load(stream)
+        if compare(current, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(cli(sys.argv[1:]))
@@ -0,0 +1,15 @@
+"""Синтетические пакеты RUN/WLK/SWM для замеров."""
+from typing import Dict, List
+
+from synthetic import (DEFAULT_MIX, Package, SyntheticWorkload,
+                       WorkloadProfile, parse_mix)
+
+__all__ = ['DEFAULT_MIX', 'Package', 'parse_mix', 'synthetic_backlog']
+
+
+def synthetic_backlog(count: int,
+                      mix: Dict[str, float] = DEFAULT_MIX,
+                      seed: int = 0) -> List[Package]:
+    """Построить `count` пакетов в заданной пропорции типов."""
+    workload = SyntheticWorkload(WorkloadProfile(mix=dict(mix)), seed)
+    return list(workload.packages(count))
@@ -0,0 +1,85 @@
+"""Командная строка трекера: пакеты из файлов или stdin в отчёт.
+
+Тяжёлые части (пул процессов, двоичный формат, хранилище, numpy)
+импортируются только тогда, когда их требуют аргументы, поэтому простой
+запуск стартует почти так же быстро, как пустой интерпретатор.
+
+Пример: python cli.py packages.txt --format jsonl --workers 4
+"""
+import argparse
+import sys
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import homework
+
+Package = Tuple[str, Sequence]
+
+INPUT_FORMATS = ('text', 'binary')
+OUTPUT_FORMATS = ('text', 'csv', 'jsonl')
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Разобрать аргументы командной строки."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('inputs', nargs='*', default=['-'],
+                        help='файлы с пакетами, `-` — stdin')
+    parser.add_argument('--input-format', choices=INPUT_FORMATS,
+                        default='text',
+                        help='строки `RUN,15000,1,75` или формат wire')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='text',
+                        help='формат вывода')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='число процессов, 0 — по числу ядер')
+    parser.add_argument('--chunk-size', type=int, default=1000,
+                        help='пакетов в части для пула процессов')
+    parser.add_argument('--block-size', type=int, default=4096,
+                        help='сообщений в одном блоке вывода')
+    parser.add_argument('--render-threads', type=int, default=1,
+                        help='потоков для отрисовки блоков вывода')
+    return parser.parse_args(argv)
+
+
+def read_inputs(paths: Iterable[str], input_format: str) -> Iterator[Package]:
+    """Лениво прочитать пакеты из всех входов по очереди."""
+    for path in paths:
+        if input_format == 'text':
+            yield from homework.read_packages(homework.iter_lines(path))
+        elif path == '-':
+            from wire import iter_records
+            yield from iter_records(sys.stdin.buffer.read())
+        else:
+            from wire import iter_capture
+            yield from iter_capture(path)
+
+
+def compute(packages: Iterable[Package], workers: int,
+            chunk_size: int) -> Iterator[homework.InfoMessage]:
+    """Рассчитать пакеты в этом процессе или в пуле процессов."""
+    if workers == 1:
+        for workout_type, data in packages:
+            training = homework.read_package(workout_type, data)
+            yield training.show_training_info()
+        return
+    from parallel import process_packages
+    yield from process_packages(packages, workers=workers or None,
+                                chunk_size=chunk_size)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа; возвращает код завершения."""
+    args = parse_args(argv)
+    from report import write_reports
+    packages = read_inputs(args.inputs, args.input_format)
+    try:
+        write_reports(compute(packages, args.workers, args.chunk_size),
+                      sys.stdout, args.format, args.block_size,
+                      args.render_threads)
+    except (ValueError, TypeError, ArithmeticError, OSError) as error:
+        sys.stdout.flush()
+        print(f'Ошибка: {error}', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,20 @@
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Type
+from operator import attrgetter
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, Sequence, Tuple, Type, Union)
+
+# Объект с методами `start()` и `finish(точка, тип, начало)`,
+# см. `set_hooks()`. Пока он не задан, замеры стоят одной проверки.
+_hooks: Any = None
 
 
 @dataclass
 class InfoMessage:
     """Информационное сообщение о тренировке."""
 
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
+
     training_type: str
     duration: float
     distance: float
@@ -14,19 +23,184 @@ class InfoMessage:
 
     def get_message(self) -> str:
         """Метод возвращает строку сообщения"""
-        return (f'Тип тренировки: {self.training_type}; '
-                f'Длительность: {self.duration:.3f} ч.; '
-                f'Дистанция: {self.distance:.3f} км; '
-                f'Ср. скорость: {self.speed:.3f} км/ч; '
-                f'Потрачено ккал: {self.calories:.3f}.')
-
-
-class Training():
+        hooks = _hooks
+        if hooks is not None:
+            started = hooks.start()
+        message = (f'Тип тренировки: {self.training_type}; '
+                   f'Длительность: {self.duration:.3f} ч.; '
+                   f'Дистанция: {self.distance:.3f} км; '
+                   f'Ср. скорость: {self.speed:.3f} км/ч; '
+                   f'Потрачено ккал: {self.calories:.3f}.')
+        if hooks is not None:
+            hooks.finish('get_message', self.training_type, started)
+        return message
+
+
+def _cached_metric(name: str) -> Callable[['Training'], float]:
+    """Метод показателя, запоминающий результат до смены входных данных.
+
+    Пара `(входные данные, результат)` хранится в словаре самого объекта,
+    поэтому копии тренировки кэшируют независимо.
+    """
+    slot = f'_cached_{name}'
+
+    def metric(self: 'Training') -> float:
+        key = self.read_inputs(self)
+        cached = self.__dict__.get(slot)
+        if cached is None or cached[0] != key:
+            value = getattr(self._uncached, name)(self)
+            cached = self.__dict__[slot] = (key, value)
+        return cached[1]
+
+    metric.__name__ = metric.__qualname__ = name
+    return metric
+
+
+def _restore_cached(training_class: type,
+                    state: Dict[str, Any]) -> 'Training':
+    """Восстановить тренировку с включённым кэшем (для `copy` и `pickle`)."""
+    training = object.__new__(training_class)
+    training.__dict__.update(state)
+    training.enable_metrics_cache()
+    return training
+
+
+_cached_classes: Dict[type, type] = {}
+
+
+def _cached_class(training_class: type) -> type:
+    """Подкласс с кэширующими методами показателей, один на класс."""
+    cached = _cached_classes.get(training_class)
+    if cached is None:
+        namespace: Dict[str, Any] = {
+            name: _cached_metric(name) for name in training_class.METRICS}
+        namespace.update(
+            __module__=training_class.__module__,
+            __qualname__=training_class.__qualname__,
+            _uncached=training_class,
+            __reduce_ex__=lambda self, protocol: (
+                _restore_cached, (self._uncached, self.__dict__)))
+        cached = _cached_classes[training_class] = type(training_class)(
+            training_class.__name__, (training_class,), namespace)
+    return cached
+
+
+def _metrics_overridden(training_class: type, owner: type) -> bool:
+    """Заменён ли какой-то метод показателя после класса с шаблоном.
+
+    Заменённым считается метод, найденный в MRO раньше `owner`, и метод,
+    присвоенный классу уже после его объявления.
+    """
+    mro = training_class.__mro__
+    for name in training_class.METRICS:
+        defined_in = next(cls for cls in mro if name in vars(cls))
+        if mro.index(defined_in) < mro.index(owner):
+            return True
+        declared = vars(defined_in).get('_declared_metrics', {})
+        if vars(defined_in)[name] is not declared.get(name):
+            return True
+    return False
+
+
+def compile_kernel(training_class: type,
+                   bound: bool = False) -> Optional[Callable[..., Any]]:
+    """Собрать функцию расчёта дистанции, скорости и калорий для класса.
+
+    Константы класса из шаблона `KERNEL_SOURCE` становятся значениями по
+    умолчанию именованных аргументов функции, а позиционные аргументы —
+    это `INPUT_ATTRS`; с `bound=True` функция вместо них принимает
+    тренировку и сама читает её атрибуты, а если у объекта есть
+    атрибуты сверх `INPUT_ATTRS` (например, переопределённый метод),
+    считает методами. Порядок операций совпадает с методами, поэтому
+    результаты совпадают до бита. Если метод показателя заменён (в
+    подклассе, примеси или присваиванием классу), функция не собирается.
+    """
+    owner = next((cls for cls in training_class.__mro__
+                  if 'KERNEL_SOURCE' in vars(cls)), None)
+    if (owner is None or owner.KERNEL_SOURCE is None
+            or _metrics_overridden(training_class, owner)):
+        return None
+    body = [line.strip() for line in owner.KERNEL_SOURCE.strip().splitlines()]
+    names = compile('\n'.join(body), '<kernel>', 'exec').co_names
+    defaults = {name: getattr(training_class, name) for name in names
+                if name.isupper() and hasattr(training_class, name)}
+    inputs = training_class.INPUT_ATTRS
+    if bound:
+        body = [f'if len(self.__dict__) != {len(inputs)}:',
+                '    return _methods(self)',
+                f'{", ".join(inputs)}, = '
+                f'{", ".join(f"self.{name}" for name in inputs)}', *body]
+        inputs = ('self',)
+        defaults['_methods'] = training_class._method_metrics
+    source = (f'def kernel({", ".join((*inputs, "*", *defaults))}):\n'
+              + ''.join(f'    {line}\n' for line in body)
+              + '    return distance, speed, calories\n')
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    kernel = namespace['kernel']
+    kernel.__kwdefaults__ = defaults
+    return kernel
+
+
+def _compile_kernels(training_class: type) -> None:
+    """Пересобрать `read_inputs`, `KERNEL` и `_metrics` класса и потомков."""
+    family = [training_class]
+    for cls in family:
+        family.extend(subclass for subclass in cls.__subclasses__()
+                      if subclass not in family)
+    setattr_ = type.__setattr__
+    for cls in family:
+        kernel = compile_kernel(cls)
+        setattr_(cls, 'read_inputs', attrgetter(*cls.INPUT_ATTRS))
+        setattr_(cls, 'KERNEL', kernel and staticmethod(kernel))
+        setattr_(cls, '_metrics', compile_kernel(cls, bound=True)
+                 or cls._method_metrics)
+
+
+class _TrainingMeta(type):
+    """Метакласс тренировок: держит функции расчёта в согласии с классом.
+
+    Присваивание или удаление константы (имя в верхнем регистре) или
+    метода показателя на классе пересобирает `KERNEL` и `_metrics` этого
+    класса и его подклассов.
+    """
+
+    def __init__(cls, name: str, bases: Tuple[type, ...],
+                 namespace: Dict[str, Any], **kwargs: Any) -> None:
+        super().__init__(name, bases, namespace, **kwargs)
+        type.__setattr__(cls, '_declared_metrics', {
+            metric: namespace[metric] for metric in cls.METRICS
+            if metric in namespace})
+        _compile_kernels(cls)
+
+    def _affects_kernel(cls, name: str) -> bool:
+        return name in cls.METRICS or name.isupper() and name != 'KERNEL'
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if cls._affects_kernel(name):
+            _compile_kernels(cls)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if cls._affects_kernel(name):
+            _compile_kernels(cls)
+
+
+class Training(metaclass=_TrainingMeta):
     """Базовый класс тренировки."""
 
     M_IN_KM: float = 1000
     LEN_STEP: float = 0.65
     MIN_IN_HOUR: int = 60
+    INPUT_ATTRS: Tuple[str, ...] = ('action', 'duration_h', 'weight_kg')
+    METRICS: Tuple[str, ...] = ('get_distance',
+                                'get_mean_speed',
+                                'get_spent_calories')
+    # Шаблон тела `KERNEL`: присваивает distance, speed и calories.
+    KERNEL_SOURCE: Optional[str] = None
+    KERNEL: Optional[Callable[..., Tuple[float, float, float]]] = None
+    read_inputs = attrgetter(*INPUT_ATTRS)
 
     def __init__(self,
                  action: int,
@@ -37,6 +211,26 @@ class Training():
         self.duration_h = duration
         self.weight_kg = weight
 
+    def get_inputs(self) -> Tuple[Any, ...]:
+        """Получить входные данные, от которых зависят показатели."""
+        return self.read_inputs(self)
+
+    def enable_metrics_cache(self) -> None:
+        """Запоминать показатели, пока не изменятся входные данные.
+
+        Объект переключается на подкласс с кэширующими методами, поэтому
+        без кэша методы показателей ничего лишнего не проверяют.
+        """
+        if '_uncached' not in vars(type(self)):
+            self.__class__ = _cached_class(type(self))
+
+    def disable_metrics_cache(self) -> None:
+        """Вернуть расчёт показателей при каждом вызове."""
+        if '_uncached' in vars(type(self)):
+            self.__class__ = self._uncached
+        for name in self.METRICS:
+            self.__dict__.pop(f'_cached_{name}', None)
+
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
         return self.action * self.LEN_STEP / self.M_IN_KM
@@ -49,13 +243,29 @@ class Training():
         """Получить количество затраченных калорий."""
         raise NotImplementedError('Метод еще не реализован.')
 
+    def _method_metrics(self) -> Tuple[float, float, float]:
+        """Дистанция, скорость и калории, посчитанные методами."""
+        return (self.get_distance(),
+                self.get_mean_speed(),
+                self.get_spent_calories())
+
+    # У типов с шаблоном заменяется собранной `compile_kernel` функцией.
+    _metrics = _method_metrics
+
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
-        return InfoMessage(self.__class__.__name__,
+        hooks = _hooks
+        if hooks is not None:
+            started = hooks.start()
+        distance, speed, calories = self._metrics()
+        info = InfoMessage(self.__class__.__name__,
                            self.duration_h,
-                           self.get_distance(),
-                           self.get_mean_speed(),
-                           self.get_spent_calories())
+                           distance,
+                           speed,
+                           calories)
+        if hooks is not None:
+            hooks.finish('show_training_info', info.training_type, started)
+        return info
 
 
 class Running(Training):
@@ -63,6 +273,12 @@ class Running(Training):
 
     COEF_CALORIE_1: int = 18
     COEF_CALORIE_2: int = 20
+    KERNEL_SOURCE = '''
+        distance = action * LEN_STEP / M_IN_KM
+        speed = distance / duration_h
+        calories = ((COEF_CALORIE_1 * speed - COEF_CALORIE_2)
+                    * weight_kg / M_IN_KM * duration_h * MIN_IN_HOUR)
+    '''
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
@@ -81,6 +297,15 @@ class SportsWalking(Training):
     COEF_CALORIE_1: float = 0.035
     COEF_CALORIE_2: int = 2
     COEF_CALORIE_3: float = 0.029
+    INPUT_ATTRS = Training.INPUT_ATTRS + ('height',)
+    KERNEL_SOURCE = '''
+        distance = action * LEN_STEP / M_IN_KM
+        speed = distance / duration_h
+        calories = ((COEF_CALORIE_1 * weight_kg
+                    + (distance ** COEF_CALORIE_2 // height)
+                    * COEF_CALORIE_3 * weight_kg)
+                    * duration_h * MIN_IN_HOUR)
+    '''
 
     def __init__(self,
                  action: int,
@@ -110,6 +335,13 @@ class Swimming(Training):
     LEN_STEP: float = 1.38
     COEF_CALORIE_1: float = 1.1
     COEF_CALORIE_2: int = 2
+    INPUT_ATTRS = Training.INPUT_ATTRS + ('length_pool', 'count_pool')
+    KERNEL_SOURCE = '''
+        distance = action * LEN_STEP / M_IN_KM
+        speed = length_pool * count_pool / M_IN_KM / duration_h
+        calories = ((speed + COEF_CALORIE_1)
+                    * COEF_CALORIE_2 * weight_kg)
+    '''
 
     def __init__(self,
                  action: int,
@@ -139,20 +371,141 @@ class Swimming(Training):
                 * self.weight_kg)
 
 
+class TrainingSpec(NamedTuple):
+    """Зарегистрированный тип тренировки."""
+
+    training_class: Type[Training]
+    arity: int
+    factory: Callable[[Sequence[Any]], Training]
+
+
+TRAINING_TYPES: Dict[str, TrainingSpec] = {}
+
+
+def attribute_factory(training_class: Type[Training]
+                      ) -> Callable[[Sequence[Any]], Training]:
+    """Собрать быстрый конструктор, минующий цепочку `__init__`.
+
+    Подходит только классам, чей `__init__` лишь присваивает параметры
+    атрибутам `INPUT_ATTRS` в том же порядке.
+    """
+    targets = ', '.join(f'training.{name}'
+                        for name in training_class.INPUT_ATTRS)
+    namespace = {'new': object.__new__, 'cls': training_class}
+    exec(f'def build(data):\n'
+         f'    training = new(cls)\n'
+         f'    {targets}, = data\n'
+         f'    return training\n', namespace)
+    return namespace['build']
+
+
+def register_training(workout_type: str,
+                      training_class: Type[Training],
+                      factory: Optional[Callable[[Sequence[Any]],
+                                                 Training]] = None
+                      ) -> None:
+    """Зарегистрировать тип тренировки для `read_package`.
+
+    Число значений пакета равно длине `INPUT_ATTRS` класса. Без `factory`
+    объект создаётся обычным вызовом класса.
+    """
+    if factory is None:
+        def factory(data: Sequence[Any]) -> Training:
+            return training_class(*data)
+    TRAINING_TYPES[workout_type] = TrainingSpec(
+        training_class, len(training_class.INPUT_ATTRS), factory)
+
+
+register_training('SWM', Swimming, attribute_factory(Swimming))
+register_training('RUN', Running, attribute_factory(Running))
+register_training('WLK', SportsWalking, attribute_factory(SportsWalking))
+
+
 def read_package(workout_type: str, data: List[int]) -> Training:
     """Прочитать данные полученные от датчиков."""
-    from_code_to_type: Dict[str, Type[Training]] = {'SWM': Swimming,
-                                                    'RUN': Running,
-                                                    'WLK': SportsWalking}
-    if workout_type not in from_code_to_type:
+    spec = TRAINING_TYPES.get(workout_type)
+    if spec is None:
         raise ValueError('Неверный ключ')
-    return from_code_to_type[workout_type](*data)
+    if len(data) != spec.arity:
+        raise ValueError(f'Пакет {workout_type} должен содержать '
+                         f'{spec.arity} значений, получено {len(data)}')
+    hooks = _hooks
+    if hooks is not None:
+        started = hooks.start()
+    training = spec.factory(data)
+    if hooks is not None:
+        hooks.finish('read_package', spec.training_class.__name__, started)
+    return training
+
+
+def set_hooks(hooks: Any) -> None:
+    """Включить замеры горячих путей или отключить их, передав `None`."""
+    global _hooks
+    _hooks = hooks
+
+
+def parse_number(value: str) -> Union[int, float]:
+    """Преобразовать поле пакета в число."""
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def parse_package(line: str) -> Tuple[str, List[Union[int, float]]]:
+    """Разобрать строку пакета вида `SWM,720,1,80,25,40`."""
+    workout_type, *fields = line.strip().split(',')
+    try:
+        data = [parse_number(field) for field in fields]
+    except ValueError:
+        raise ValueError(f'Некорректный пакет: {line.strip()!r}') from None
+    return workout_type.strip(), data
+
+
+def iter_lines(path: str = '-') -> Iterator[str]:
+    """Лениво читать строки из файла или stdin (`-`)."""
+    if path == '-':
+        yield from sys.stdin
+        return
+    with open(path, encoding='utf-8') as stream:
+        yield from stream
+
+
+def read_packages(lines: Iterable[str]
+                  ) -> Iterator[Tuple[str, List[Union[int, float]]]]:
+    """Лениво разобрать пакеты, пропуская пустые строки."""
+    for line in lines:
+        if line.strip():
+            yield parse_package(line)
+
+
+def stream_trainings(lines: Iterable[str]) -> Iterator[Training]:
+    """Лениво создать тренировки из строк пакетов."""
+    for workout_type, data in read_packages(lines):
+        yield read_package(workout_type, data)
+
+
+def stream_messages(lines: Iterable[str]) -> Iterator[InfoMessage]:
+    """Лениво вернуть информационные сообщения для строк пакетов."""
+    for training in stream_trainings(lines):
+        yield training.show_training_info()
+
+
+def stream_reports(lines: Iterable[str]) -> Iterator[str]:
+    """Лениво вернуть готовые строки сообщений для строк пакетов."""
+    for info in stream_messages(lines):
+        yield info.get_message()
 
 
 def main(training: Training) -> None:
     """Главная функция. Финальный вывод данных в консоль"""
+    hooks = _hooks
+    if hooks is not None:
+        started = hooks.start()
     info = training.show_training_info()
     print(info.get_message())
+    if hooks is not None:
+        hooks.finish('main', info.training_type, started)
 
 
 """Имитация получения данных от блока датчиков фитнес-трекера"""
@@ -0,0 +1,134 @@
+"""Счётчики, гистограммы задержек и профилирование горячих путей.
+
+Точки замера: `read_package`, `show_training_info`, `get_message` и
+`main`. Пока инструментирование не включено, каждая точка стоит одной
+проверки глобальной переменной `homework._hooks`.
+"""
+import cProfile
+import io
+import pstats
+import tracemalloc
+from bisect import bisect_left
+from collections import defaultdict
+from time import perf_counter_ns
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+
+import homework
+
+Key = Tuple[str, str]
+
+# Верхние границы корзин гистограммы в наносекундах; последняя корзина
+# собирает всё, что медленнее последней границы.
+BUCKETS_NS: Tuple[int, ...] = (
+    500, 1_000, 2_000, 5_000, 10_000, 20_000, 50_000,
+    100_000, 1_000_000, 10_000_000)
+PROFILERS = ('cprofile', 'tracemalloc')
+
+
+class Instrumentation:
+    """Сборщик замеров по точке и типу тренировки."""
+
+    def __init__(self, buckets_ns: Tuple[int, ...] = BUCKETS_NS) -> None:
+        self.buckets_ns = buckets_ns
+        self.counts: DefaultDict[Key, int] = defaultdict(int)
+        self.total_ns: DefaultDict[Key, int] = defaultdict(int)
+        self.histograms: Dict[Key, List[int]] = {}
+        self.profile_report: Optional[str] = None
+        self._profiler: Optional[str] = None
+        self._profile: Optional[cProfile.Profile] = None
+        self._profile_left = 0
+
+    def __enter__(self) -> 'Instrumentation':
+        self.enable()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.disable()
+
+    def enable(self) -> None:
+        """Подключить замеры к `homework`."""
+        homework.set_hooks(self)
+
+    def disable(self) -> None:
+        """Отключить замеры и завершить незаконченное профилирование."""
+        if homework._hooks is self:
+            homework.set_hooks(None)
+        if self._profiler is not None:
+            self._stop_profile()
+
+    def start(self) -> int:
+        """Отметка времени начала замера."""
+        return perf_counter_ns()
+
+    def finish(self, point: str, workout_type: str, started: int) -> None:
+        """Учесть завершённый замер."""
+        elapsed = perf_counter_ns() - started
+        key = (point, workout_type)
+        self.counts[key] += 1
+        self.total_ns[key] += elapsed
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = [0] * (len(self.buckets_ns) + 1)
+            self.histograms[key] = histogram
+        histogram[bisect_left(self.buckets_ns, elapsed)] += 1
+        if self._profiler is not None and point == 'read_package':
+            self._profile_left -= 1
+            if self._profile_left <= 0:
+                self._stop_profile()
+
+    def profile(self, packages: int, profiler: str = 'cprofile') -> None:
+        """Профилировать обработку следующих `packages` пакетов.
+
+        Окно отсчитывается по вызовам `read_package`, поэтому замеры
+        должны быть включены (`enable()`); отчёт после завершения окна
+        доступен в `profile_report`.
+        """
+        if profiler not in PROFILERS:
+            raise ValueError(f'Неизвестный профилировщик: {profiler}')
+        if homework._hooks is not self:
+            raise RuntimeError('Замеры не включены: вызовите enable()')
+        if self._profiler is not None:
+            raise RuntimeError('Профилирование уже запущено')
+        self.profile_report = None
+        self._profiler = profiler
+        self._profile_left = packages
+        if profiler == 'cprofile':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            tracemalloc.start()
+
+    def _stop_profile(self) -> None:
+        report = io.StringIO()
+        if self._profile is not None:
+            self._profile.disable()
+            stats = pstats.Stats(self._profile, stream=report)
+            stats.sort_stats('cumulative').print_stats(20)
+            self._profile = None
+        else:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            for stat in snapshot.statistics('lineno')[:20]:
+                report.write(f'{stat}\n')
+        self._profiler = None
+        self.profile_report = report.getvalue()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Текущие счётчики и гистограммы в виде, пригодном для JSON."""
+        return {
+            'buckets_ns': list(self.buckets_ns),
+            'points': [{'point': point,
+                        'workout_type': workout_type,
+                        'count': count,
+                        'total_ns': self.total_ns[point, workout_type],
+                        'histogram': list(
+                            self.histograms[point, workout_type])}
+                       for (point, workout_type), count
+                       in sorted(self.counts.items())],
+        }
+
+    def reset(self) -> None:
+        """Обнулить счётчики и гистограммы."""
+        self.counts.clear()
+        self.total_ns.clear()
+        self.histograms.clear()
@@ -0,0 +1,87 @@
+"""Параллельная обработка пакетов в пуле процессов."""
+import os
+from collections import deque
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                wait)
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from homework import InfoMessage, read_package
+
+Package = Tuple[str, Sequence[Union[int, float]]]
+Result = Union[InfoMessage, str]
+
+
+def process_chunk(chunk: List[Package],
+                  formatted: bool = False) -> List[Result]:
+    """Обработать часть пакетов: `read_package` и `show_training_info`."""
+    results: List[Result] = []
+    for workout_type, data in chunk:
+        info = read_package(workout_type, data).show_training_info()
+        results.append(info.get_message() if formatted else info)
+    return results
+
+
+def iter_chunks(packages: Iterable[Package],
+                chunk_size: int) -> Iterator[List[Package]]:
+    """Разбить поток пакетов на списки по `chunk_size` штук."""
+    if chunk_size < 1:
+        raise ValueError('Размер части должен быть положительным')
+    packages = iter(packages)
+    while True:
+        chunk = list(islice(packages, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _ordered(pool: ProcessPoolExecutor,
+             chunks: Iterator[List[Package]],
+             formatted: bool,
+             max_pending: int) -> Iterator[Result]:
+    """Выдавать результаты частей в порядке поступления пакетов."""
+    pending: 'deque[Future]' = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(process_chunk, chunk, formatted))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def _unordered(pool: ProcessPoolExecutor,
+               chunks: Iterator[List[Package]],
+               formatted: bool,
+               max_pending: int) -> Iterator[Result]:
+    """Выдавать результаты частей по мере их готовности."""
+    pending = set()
+    for chunk in chunks:
+        pending.add(pool.submit(process_chunk, chunk, formatted))
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    for future in pending:
+        yield from future.result()
+
+
+def process_packages(packages: Iterable[Package],
+                     workers: Optional[int] = None,
+                     chunk_size: int = 1000,
+                     ordered: bool = True,
+                     formatted: bool = False) -> Iterator[Result]:
+    """Обработать поток пакетов в `workers` процессах.
+
+    Пакеты читаются лениво: одновременно в работе не больше двух частей
+    на процесс. При `formatted=True` возвращаются готовые строки
+    `get_message()`, что сокращает объём данных между процессами.
+    """
+    chunks = iter_chunks(packages, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield from process_chunk(chunk, formatted)
+        return
+    workers = workers or os.cpu_count() or 1
+    collect = _ordered if ordered else _unordered
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from collect(pool, chunks, formatted, 2 * workers)
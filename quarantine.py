@@ -0,0 +1,325 @@
+"""Отказоустойчивая пакетная обработка с карантином ошибочных записей.
+
+Входной файл читается частями. В каждой части пакеты раскладываются по
+колонкам, проверяются и рассчитываются векторно (`batch.py`), а записи,
+которые нельзя разобрать или рассчитать, уходят в файл карантина в
+формате JSON Lines с кодом причины. После каждой части сохраняется
+контрольная точка: смещение во входном файле и размеры выходных файлов.
+Повторный запуск обрезает выходные файлы до сохранённых размеров и
+продолжает с того же смещения, поэтому после сбоя ни одна запись не
+теряется и не выводится дважды.
+
+Пример: python quarantine.py big.txt --output report.txt
+--quarantine bad.jsonl --checkpoint big.ckpt
+"""
+import argparse
+import heapq
+import json
+import mmap
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from operator import itemgetter
+from typing import (BinaryIO, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, Sequence, Tuple)
+
+from batch import (BATCH_COLUMNS, REJECT_REASONS, calculate_batch,
+                   invalid_rows, select_rows)
+from homework import InfoMessage
+from report import FIELDS, RENDERERS
+from wire import WIRE_CODES, WIRE_RECORDS, record_size
+
+CHUNK_SIZE = 65536
+# Причины карантина: ошибки разбора, формата wire и расчёта.
+PARSE_REASONS = ('unknown_type', 'wrong_arity', 'bad_number')
+WIRE_REASONS = ('bad_record', 'truncated')
+QUARANTINE_REASONS = (PARSE_REASONS + WIRE_REASONS + REJECT_REASONS
+                      + ('calculation_error',))
+# Сколько байт испорченного хвоста файла wire показать в карантине.
+RECORD_PREVIEW = 64
+_WIRE_TYPES = {code: workout_type
+               for workout_type, code in WIRE_CODES.items()}
+
+
+class Entry(NamedTuple):
+    """Запись входного файла: границы, исходный вид и разобранный пакет.
+
+    У корректных записей wire исходный вид `None`: он нужен только
+    карантину и читается из файла по границам.
+    """
+
+    offset: int
+    end: int
+    record: Optional[str]
+    workout_type: str = ''
+    data: Sequence[float] = ()
+    reason: Optional[str] = None
+
+
+_new_entry = tuple.__new__
+
+
+@dataclass
+class Checkpoint:
+    """Состояние обработки после последней завершённой части."""
+
+    offset: int = 0
+    output_size: int = 0
+    quarantine_size: int = 0
+    processed: int = 0
+    quarantined: int = 0
+    reasons: Dict[str, int] = field(default_factory=dict)
+
+    def save(self, path: str) -> None:
+        """Атомарно записать контрольную точку в файл."""
+        temporary = path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as stream:
+            json.dump({'version': 1, **asdict(self)}, stream)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'Checkpoint':
+        """Загрузить контрольную точку; без файла — начать сначала."""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, encoding='utf-8') as stream:
+            state = json.load(stream)
+        if state.pop('version', None) != 1:
+            raise ValueError('Неподдерживаемая версия контрольной точки')
+        return cls(**state)
+
+
+def parse_entry(offset: int, end: int, line: str) -> Entry:
+    """Разобрать строку пакета, не выбрасывая исключений."""
+    workout_type, *fields = line.split(',')
+    workout_type = workout_type.strip()
+    if workout_type not in BATCH_COLUMNS:
+        return Entry(offset, end, line, reason='unknown_type')
+    if len(fields) != len(BATCH_COLUMNS[workout_type]):
+        return Entry(offset, end, line, reason='wrong_arity')
+    try:
+        # Колонки всё равно хранятся в float64, поэтому `parse_number`
+        # с его попыткой `int()` не нужен.
+        data = list(map(float, fields))
+    except ValueError:
+        return Entry(offset, end, line, reason='bad_number')
+    # Так же, как `Entry._make`, но без лишних вызовов: эта ветка
+    # выполняется для каждой корректной записи.
+    return _new_entry(Entry, (offset, end, line, workout_type, data, None))
+
+
+def read_text(path: str, offset: int = 0) -> Iterator[Entry]:
+    """Читать строки пакетов, начиная с байтового смещения `offset`."""
+    with open(path, 'rb') as stream:
+        stream.seek(offset)
+        for raw in stream:
+            end = offset + len(raw)
+            line = raw.decode('utf-8', 'replace').strip()
+            if line:
+                yield parse_entry(offset, end, line)
+            offset = end
+
+
+def read_wire(path: str, offset: int = 0) -> Iterator[Entry]:
+    """Читать записи wire, начиная с байтового смещения `offset`.
+
+    После записи с неизвестным кодом границы следующих записей не найти,
+    поэтому остаток файла целиком уходит в карантин.
+    """
+    with open(path, 'rb') as stream:
+        size = os.fstat(stream.fileno()).st_size
+        if offset >= size:
+            return
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            while offset < size:
+                code = view[offset]
+                if code not in _WIRE_TYPES:
+                    yield Entry(offset, size,
+                                view[offset:offset + RECORD_PREVIEW].hex(),
+                                reason='bad_record')
+                    return
+                end = offset + record_size(code)
+                if end > size:
+                    yield Entry(offset, size, view[offset:size].hex(),
+                                reason='truncated')
+                    return
+                workout_type = _WIRE_TYPES[code]
+                data = WIRE_RECORDS[workout_type].unpack_from(view, offset)
+                yield _new_entry(Entry, (offset, end, None, workout_type,
+                                         data[1:], None))
+                offset = end
+
+
+READERS = {'text': read_text, 'binary': read_wire}
+
+
+def _calculate(workout_type: str, entries: List[Entry],
+               rejected: List[Entry]) -> List[Tuple[int, InfoMessage]]:
+    """Рассчитать пакеты одного типа, отправив ошибочные в `rejected`."""
+    columns = {name: [entry.data[index] for entry in entries]
+               for index, name in enumerate(BATCH_COLUMNS[workout_type])}
+    invalid = invalid_rows(workout_type, columns)
+    if invalid:
+        rejected.extend(entries[row]._replace(reason=reason)
+                        for row, reason in invalid.items())
+        rows = [row for row in range(len(entries)) if row not in invalid]
+        entries = [entries[row] for row in rows]
+        columns = select_rows(columns, rows)
+    try:
+        result = calculate_batch(workout_type, columns)
+    except ArithmeticError:
+        # Редкий случай: ошибку даёт строка, прошедшая проверку. Считаем
+        # строки по одной, чтобы отправить в карантин только её.
+        messages = []
+        for row, entry in enumerate(entries):
+            try:
+                result = calculate_batch(workout_type,
+                                         select_rows(columns, [row]))
+            except ArithmeticError:
+                rejected.append(entry._replace(reason='calculation_error'))
+            else:
+                messages.append((entry.offset, next(result.messages())))
+        return messages
+    return [(entry.offset, info)
+            for entry, info in zip(entries, result.messages())]
+
+
+def process_entries(entries: Iterable[Entry]
+                    ) -> Tuple[List[InfoMessage], List[Entry]]:
+    """Рассчитать часть записей; вернуть сообщения и записи карантина.
+
+    И те и другие идут в порядке записей во входном файле.
+    """
+    by_type: Dict[str, List[Entry]] = {}
+    rejected: List[Entry] = []
+    for entry in entries:
+        if entry.reason is None:
+            by_type.setdefault(entry.workout_type, []).append(entry)
+        else:
+            rejected.append(entry)
+    calculated = [_calculate(workout_type, group, rejected)
+                  for workout_type, group in by_type.items()]
+    messages = [info for _, info in heapq.merge(*calculated,
+                                                key=itemgetter(0))]
+    rejected.sort(key=itemgetter(0))
+    return messages, rejected
+
+
+def _quarantine_line(entry: Entry, source: BinaryIO) -> str:
+    record = entry.record
+    if record is None:
+        source.seek(entry.offset)
+        record = source.read(entry.end - entry.offset).hex()
+    return json.dumps({'offset': entry.offset, 'reason': entry.reason,
+                       'record': record}, ensure_ascii=False) + '\n'
+
+
+def _open_at(path: str, size: int):
+    """Открыть выходной файл для дозаписи, обрезав его до `size` байт."""
+    stream = open(path, 'ab')
+    if stream.seek(0, os.SEEK_END) < size:
+        stream.close()
+        raise ValueError(f'Файл {path} короче контрольной точки')
+    stream.truncate(size)
+    stream.seek(size)
+    return stream
+
+
+def _sync(stream) -> int:
+    """Сбросить файл на диск и вернуть его размер."""
+    stream.flush()
+    os.fsync(stream.fileno())
+    return stream.tell()
+
+
+def process_file(path: str,
+                 output_path: str,
+                 quarantine_path: str,
+                 checkpoint_path: Optional[str] = None,
+                 input_format: str = 'text',
+                 output_format: str = 'text',
+                 chunk_size: int = CHUNK_SIZE) -> Checkpoint:
+    """Обработать файл частями по `chunk_size` записей.
+
+    С `checkpoint_path` обработка продолжается с сохранённой контрольной
+    точки, а после каждой части точка обновляется. Возвращает итоговое
+    состояние.
+    """
+    if input_format not in READERS:
+        raise ValueError(f'Неизвестный формат ввода: {input_format}')
+    if output_format not in RENDERERS:
+        raise ValueError(f'Неизвестный формат вывода: {output_format}')
+    if chunk_size < 1:
+        raise ValueError('Размер части должен быть положительным')
+    state = Checkpoint.load(checkpoint_path) if checkpoint_path else (
+        Checkpoint())
+    render = RENDERERS[output_format]
+    entries = READERS[input_format](path, state.offset)
+    with _open_at(output_path, state.output_size) as output, \
+            _open_at(quarantine_path, state.quarantine_size) as quarantine, \
+            open(path, 'rb') as source:
+        if output_format == 'csv' and not state.output_size:
+            output.write((','.join(FIELDS) + '\n').encode('utf-8'))
+        while True:
+            chunk = list(islice(entries, chunk_size))
+            if not chunk:
+                return state
+            messages, rejected = process_entries(chunk)
+            if messages:
+                output.write(render(messages).encode('utf-8'))
+            quarantine.write(''.join([_quarantine_line(entry, source)
+                                      for entry in rejected])
+                             .encode('utf-8'))
+            state.offset = chunk[-1].end
+            state.processed += len(messages)
+            state.quarantined += len(rejected)
+            for entry in rejected:
+                state.reasons[entry.reason] = (
+                    state.reasons.get(entry.reason, 0) + 1)
+            state.output_size = _sync(output)
+            state.quarantine_size = _sync(quarantine)
+            if checkpoint_path:
+                state.save(checkpoint_path)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Разобрать аргументы командной строки."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('input', help='файл с пакетами')
+    parser.add_argument('--output', required=True, help='файл отчёта')
+    parser.add_argument('--quarantine', required=True,
+                        help='файл карантина (JSON Lines)')
+    parser.add_argument('--checkpoint',
+                        help='файл контрольной точки для продолжения')
+    parser.add_argument('--input-format', choices=tuple(READERS),
+                        default='text')
+    parser.add_argument('--format', choices=tuple(RENDERERS),
+                        default='text', help='формат отчёта')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help='записей в одной части')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа; возвращает код завершения."""
+    args = parse_args(argv)
+    try:
+        state = process_file(args.input, args.output, args.quarantine,
+                             args.checkpoint, args.input_format,
+                             args.format, args.chunk_size)
+    except (ValueError, OSError) as error:
+        print(f'Ошибка: {error}', file=sys.stderr)
+        return 1
+    reasons = ', '.join(f'{reason}={count}'
+                        for reason, count in sorted(state.reasons.items()))
+    print(f'Рассчитано: {state.processed}, в карантине: '
+          f'{state.quarantined}' + (f' ({reasons})' if reasons else ''),
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
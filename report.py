@@ -0,0 +1,167 @@
+"""Пакетный вывод сообщений о тренировках.
+
+Модули `csv`, `json` и пул потоков импортируются при первом
+использовании, чтобы не замедлять запуск при простом текстовом выводе.
+Текст собирается по шаблону, заранее подготовленному для каждого типа
+тренировки, а большие объёмы можно отрисовывать блоками в пуле потоков.
+"""
+import io
+import sys
+from collections import deque
+from itertools import islice
+from typing import (Callable, Dict, Iterable, Iterator, List, Optional,
+                    TextIO, Tuple)
+
+import homework
+from homework import InfoMessage
+
+FIELDS = ('training_type', 'duration', 'distance', 'speed', 'calories')
+BLOCK_SIZE = 4096
+# Текст `InfoMessage.get_message()` с подставляемым типом тренировки.
+# `%.3f` даёт те же цифры, что и `:.3f`: оба округляют точное двоичное
+# значение корректно.
+MESSAGE_TEMPLATE = ('Тип тренировки: {}; '
+                    'Длительность: %.3f ч.; '
+                    'Дистанция: %.3f км; '
+                    'Ср. скорость: %.3f км/ч; '
+                    'Потрачено ккал: %.3f.\n')
+_templates: Dict[str, str] = {}
+
+
+def message_template(training_type: str) -> str:
+    """Шаблон строки сообщения для типа тренировки, собранный один раз."""
+    template = _templates.get(training_type)
+    if template is None:
+        template = _templates[training_type] = sys.intern(
+            MESSAGE_TEMPLATE.format(training_type.replace('%', '%%')))
+    return template
+
+
+def _render_text(block: List[InfoMessage]) -> str:
+    """Строки `get_message()`, по одной на тренировку."""
+    if homework._hooks is not None:
+        # Под замерами идём через `get_message()`, чтобы точка считалась.
+        return ''.join([info.get_message() + '\n' for info in block])
+    templates = _templates
+    lines = []
+    for info in block:
+        template = templates.get(info.training_type)
+        if template is None:
+            template = message_template(info.training_type)
+        lines.append(template % (info.duration, info.distance,
+                                 info.speed, info.calories))
+    return ''.join(lines)
+
+
+def _render_csv(block: List[InfoMessage]) -> str:
+    """Строки CSV без заголовка."""
+    import csv
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerows(
+        [(info.training_type, info.duration, info.distance,
+          info.speed, info.calories) for info in block])
+    return buffer.getvalue()
+
+
+def _render_jsonl(block: List[InfoMessage]) -> str:
+    """JSON-объекты, по одному на строку."""
+    from json import dumps
+    return ''.join([dumps({'training_type': info.training_type,
+                           'duration': info.duration,
+                           'distance': info.distance,
+                           'speed': info.speed,
+                           'calories': info.calories}) + '\n'
+                    for info in block])
+
+
+RENDERERS: Dict[str, Callable[[List[InfoMessage]], str]] = {
+    'text': _render_text,
+    'csv': _render_csv,
+    'jsonl': _render_jsonl,
+}
+
+
+def _rendered_blocks(render: Callable[[List[InfoMessage]], str],
+                     blocks: Iterable[List[InfoMessage]],
+                     workers: int) -> Iterator[Tuple[int, str]]:
+    """Отрисовать блоки в пуле потоков, сохранив их порядок.
+
+    Выдаёт пары `(число сообщений, текст блока)`.
+
+    В работе одновременно не больше `2 * workers` блоков, поэтому поток
+    сообщений не читается в память целиком.
+    """
+    if workers == 1:
+        for block in blocks:
+            yield len(block), render(block)
+        return
+    from concurrent.futures import Future, ThreadPoolExecutor
+    pending: 'deque[Tuple[int, Future]]' = deque()
+    error: Optional[Exception] = None
+    with ThreadPoolExecutor(workers) as pool:
+        try:
+            for block in blocks:
+                pending.append((len(block), pool.submit(render, block)))
+                if len(pending) >= 2 * workers:
+                    size, future = pending.popleft()
+                    yield size, future.result()
+        except Exception as exc:
+            error = exc
+        while pending:
+            size, future = pending.popleft()
+            yield size, future.result()
+    if error is not None:
+        raise error
+
+
+def _blocks(messages: Iterable[InfoMessage],
+            block_size: int) -> Iterator[List[InfoMessage]]:
+    """Разбить сообщения на блоки по `block_size` штук.
+
+    Если поток сообщений прерывается ошибкой, сначала выдаётся начатый
+    блок, а ошибка поднимается при запросе следующего.
+    """
+    messages = iter(messages)
+    while True:
+        block: List[InfoMessage] = []
+        try:
+            # `extend` оставляет в списке всё, что успел прочитать.
+            block.extend(islice(messages, block_size))
+        except Exception:
+            if block:
+                yield block
+            raise
+        if not block:
+            return
+        yield block
+
+
+def write_reports(messages: Iterable[InfoMessage],
+                  stream: Optional[TextIO] = None,
+                  output_format: str = 'text',
+                  block_size: int = BLOCK_SIZE,
+                  workers: int = 1) -> int:
+    """Записать сообщения в поток блоками по `block_size` штук.
+
+    Формат `text` побайтно совпадает с построчным `print(get_message())`,
+    `csv` начинается со строки заголовка. С `workers > 1` блоки
+    отрисовываются в пуле потоков, а пишутся в исходном порядке. Если
+    поток сообщений прерывается ошибкой, всё прочитанное до неё
+    записывается, а ошибка поднимается дальше. Возвращает число записей.
+    """
+    if output_format not in RENDERERS:
+        raise ValueError(f'Неизвестный формат вывода: {output_format}')
+    if block_size < 1:
+        raise ValueError('Размер блока должен быть положительным')
+    if workers < 1:
+        raise ValueError('Число потоков должно быть положительным')
+    stream = sys.stdout if stream is None else stream
+    render = RENDERERS[output_format]
+    if output_format == 'csv':
+        stream.write(','.join(FIELDS) + '\n')
+    count = 0
+    blocks = _blocks(messages, block_size)
+    for size, text in _rendered_blocks(render, blocks, workers):
+        stream.write(text)
+        count += size
+    return count
@@ -0,0 +1,65 @@
+"""LRU-кэш результатов расчёта по содержимому пакета."""
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, Sequence, Tuple, Union
+
+from homework import InfoMessage, read_package
+
+Key = Tuple[str, Tuple[Union[int, float], ...]]
+
+
+class PackageCache:
+    """Кэш `InfoMessage` с вытеснением давно не использованных пакетов.
+
+    Повторные пакеты не создают объект тренировки и не пересчитываются.
+    Возвращаемые сообщения общие для одинаковых пакетов, изменять их нельзя.
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        if maxsize < 1:
+            raise ValueError('Размер кэша должен быть положительным')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._messages: 'OrderedDict[Key, InfoMessage]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def get_message(self,
+                    workout_type: str,
+                    data: Sequence[Union[int, float]]) -> InfoMessage:
+        """Вернуть сообщение для пакета, рассчитав его при промахе."""
+        key = (workout_type, tuple(data))
+        messages = self._messages
+        info = messages.get(key)
+        if info is not None:
+            messages.move_to_end(key)
+            self.hits += 1
+            return info
+        info = read_package(workout_type, data).show_training_info()
+        self.misses += 1
+        messages[key] = info
+        if len(messages) > self.maxsize:
+            messages.popitem(last=False)
+            self.evictions += 1
+        return info
+
+    def process(self, packages: Iterable[Tuple[str, Sequence]]
+                ) -> Iterator[InfoMessage]:
+        """Лениво вернуть сообщения для потока пакетов."""
+        for workout_type, data in packages:
+            yield self.get_message(workout_type, data)
+
+    def stats(self) -> Dict[str, int]:
+        """Счётчики кэша для экспорта в мониторинг."""
+        return {'size': len(self._messages),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions}
+
+    def clear(self) -> None:
+        """Очистить кэш и счётчики."""
+        self._messages.clear()
+        self.hits = self.misses = self.evictions = 0
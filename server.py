@@ -0,0 +1,179 @@
+"""Асинхронный сервер приёма пакетов датчиков.
+
+Клиент присылает пакеты построчно (`RUN,15000,1,75`) или в двоичном
+формате `wire`, сервер отвечает строкой `get_message()` на каждый пакет
+либо строкой `Ошибка: ...` для некорректного пакета.
+"""
+import argparse
+import asyncio
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from homework import parse_package, read_package
+from wire import Package, complete_size, iter_records
+
+FRAMINGS = ('line', 'binary')
+READ_SIZE = 65536
+MAX_LINE = 4096
+
+
+def _message(workout_type: str, data: Sequence) -> str:
+    """Строка ответа для одного пакета."""
+    try:
+        info = read_package(workout_type, data).show_training_info()
+    except (ValueError, TypeError, ArithmeticError) as error:
+        return f'Ошибка: {error}'
+    return info.get_message()
+
+
+def _line_message(line: bytes) -> str:
+    """Строка ответа для одной текстовой строки пакета."""
+    try:
+        workout_type, data = parse_package(line.decode('utf-8'))
+    except (ValueError, UnicodeDecodeError) as error:
+        return f'Ошибка: {error}'
+    return _message(workout_type, data)
+
+
+def render_packages(packages: Iterable[Tuple[str, Sequence]]) -> bytes:
+    """Рассчитать разобранные пакеты и собрать ответ одним блоком."""
+    return ''.join([_message(workout_type, data) + '\n'
+                    for workout_type, data in packages]).encode('utf-8')
+
+
+def render_lines(lines: Iterable[bytes]) -> bytes:
+    """Рассчитать текстовые пакеты и собрать ответ одним блоком."""
+    return ''.join([_line_message(line) + '\n'
+                    for line in lines if line.strip()]).encode('utf-8')
+
+
+class FramingError(ValueError):
+    """Поток клиента нельзя разобрать дальше.
+
+    `response` — ответ на целые пакеты, пришедшие до ошибки.
+    """
+
+    def __init__(self, message: str, response: bytes = b'') -> None:
+        super().__init__(message)
+        self.response = response
+
+
+class IngestServer:
+    """Сервер, обрабатывающий пакеты каждого клиента микропакетами.
+
+    Всё, что пришло от клиента за одно чтение, рассчитывается вместе и
+    отправляется одним `write()`. Следующее чтение начинается только после
+    `drain()`, поэтому медленный клиент притормаживает лишь себя.
+    """
+
+    def __init__(self,
+                 framing: str = 'line',
+                 read_size: int = READ_SIZE) -> None:
+        if framing not in FRAMINGS:
+            raise ValueError(f'Неизвестный формат кадров: {framing}')
+        self.framing = framing
+        self.read_size = read_size
+        self.connections = 0
+        self.packages = 0
+
+    def _process(self, buffer: bytes) -> Tuple[bytes, bytes]:
+        """Рассчитать целые пакеты буфера, вернуть ответ и хвост."""
+        if self.framing == 'line':
+            *lines, tail = buffer.split(b'\n')
+            if len(tail) > MAX_LINE:
+                raise FramingError('Слишком длинная строка пакета')
+            self.packages += sum(1 for line in lines if line.strip())
+            return render_lines(lines), tail
+        try:
+            size = complete_size(buffer)
+        except ValueError:
+            packages: List[Package] = []
+            try:
+                # `extend` оставляет в списке записи до неверной.
+                packages.extend(iter_records(memoryview(buffer)))
+            except ValueError as error:
+                self.packages += len(packages)
+                raise FramingError(str(error),
+                                   render_packages(packages)) from None
+        packages = list(iter_records(memoryview(buffer)[:size]))
+        self.packages += len(packages)
+        return render_packages(packages), buffer[size:]
+
+    async def handle(self,
+                     reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter) -> None:
+        """Обслужить одно соединение до его закрытия клиентом."""
+        self.connections += 1
+        buffer = b''
+        try:
+            while True:
+                chunk = await reader.read(self.read_size)
+                if not chunk:
+                    break
+                try:
+                    response, buffer = self._process(buffer + chunk)
+                except FramingError as error:
+                    writer.write(error.response
+                                 + f'Ошибка: {error}\n'.encode('utf-8'))
+                    await writer.drain()
+                    return
+                if response:
+                    writer.write(response)
+                    await writer.drain()
+            if self.framing == 'line' and buffer.strip():
+                self.packages += 1
+                writer.write(render_lines([buffer]))
+            elif buffer:
+                writer.write('Ошибка: обрезанная запись\n'.encode('utf-8'))
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = 0,
+                        **kwargs) -> asyncio.AbstractServer:
+        """Запустить приём по TCP."""
+        return await asyncio.start_server(self.handle, host, port, **kwargs)
+
+    async def start_unix(self, path: str,
+                         **kwargs) -> asyncio.AbstractServer:
+        """Запустить приём через Unix-сокет."""
+        return await asyncio.start_unix_server(self.handle, path, **kwargs)
+
+
+async def query(payload: bytes,
+                host: str = '127.0.0.1',
+                port: Optional[int] = None,
+                path: Optional[str] = None) -> List[str]:
+    """Отправить пакеты серверу и вернуть строки ответа."""
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    writer.write(payload)
+    writer.write_eof()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return response.decode('utf-8').splitlines()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Запустить сервер и обслуживать клиентов до остановки."""
+    ingest = IngestServer(args.framing)
+    if args.unix:
+        server = await ingest.start_unix(args.unix)
+    else:
+        server = await ingest.start_tcp(args.host, args.port)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9000)
+    parser.add_argument('--unix', help='путь к Unix-сокету вместо TCP')
+    parser.add_argument('--framing', choices=FRAMINGS, default='line')
+    asyncio.run(serve(parser.parse_args()))
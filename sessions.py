@@ -0,0 +1,83 @@
+"""Накопление показателей тренировки по посекундным отсчётам датчиков.
+
+Датчик присылает нарастающие счётчики: шаги или гребки, а для плавания
+ещё и число проплытых бассейнов. Аккумулятор хранит одну тренировку
+(`Running`, `SportsWalking` или `Swimming`) и на каждом отсчёте обновляет
+её поля, поэтому дистанция, скорость и калории считаются теми же
+методами классов за O(1), а сессию не нужно держать в памяти целиком.
+"""
+from typing import Optional
+
+from homework import InfoMessage, Running, SportsWalking, Swimming, Training
+
+SECONDS_IN_HOUR = 3600
+
+
+class SessionAccumulator:
+    """Текущие показатели одной тренировки, собираемые по отсчётам."""
+
+    def __init__(self,
+                 workout_type: str,
+                 weight: float,
+                 started_at: float = 0.0,
+                 height: Optional[float] = None,
+                 length_pool: Optional[float] = None) -> None:
+        if workout_type == 'RUN':
+            self.training: Training = Running(0, 0, weight)
+        elif workout_type == 'WLK':
+            if height is None:
+                raise ValueError('Для спортивной ходьбы нужен рост')
+            self.training = SportsWalking(0, 0, weight, height)
+        elif workout_type == 'SWM':
+            if length_pool is None:
+                raise ValueError('Для плавания нужна длина бассейна')
+            self.training = Swimming(0, 0, weight, length_pool, 0)
+        else:
+            raise ValueError('Неверный ключ')
+        self.workout_type = workout_type
+        self.started_at = started_at
+        self.last_at = started_at
+        self.samples = 0
+
+    def add_sample(self, timestamp: float, action: int,
+                   laps: Optional[int] = None) -> None:
+        """Учесть отсчёт с нарастающими счётчиками действий и бассейнов."""
+        training = self.training
+        if timestamp < self.last_at:
+            raise ValueError('Отсчёты должны идти по возрастанию времени')
+        if action < training.action:
+            raise ValueError('Счётчик действий не может уменьшаться')
+        if laps is not None:
+            if not isinstance(training, Swimming):
+                raise ValueError('Бассейны считаются только для плавания')
+            if laps < training.count_pool:
+                raise ValueError('Счётчик бассейнов не может уменьшаться')
+            training.count_pool = laps
+        training.action = action
+        training.duration_h = (timestamp - self.started_at) / SECONDS_IN_HOUR
+        self.last_at = timestamp
+        self.samples += 1
+
+    def _ready(self) -> Training:
+        if not self.training.duration_h:
+            raise ValueError('Нет отсчётов с ненулевой длительностью')
+        return self.training
+
+    @property
+    def distance(self) -> float:
+        """Дистанция в км на момент последнего отсчёта."""
+        return self.training.get_distance()
+
+    @property
+    def mean_speed(self) -> float:
+        """Средняя скорость на момент последнего отсчёта."""
+        return self._ready().get_mean_speed()
+
+    @property
+    def calories(self) -> float:
+        """Потраченные калории на момент последнего отсчёта."""
+        return self._ready().get_spent_calories()
+
+    def finish(self) -> InfoMessage:
+        """Завершить сессию и вернуть итоговое сообщение."""
+        return self._ready().show_training_info()
@@ -0,0 +1,194 @@
+"""Обмен рассчитанными тренировками между процессами через общую память.
+
+Кольцевой буфер в `multiprocessing.shared_memory` хранит записи
+фиксированной длины: код тренировки и четыре float64 сообщения
+(длительность, дистанция, скорость, калории). Пишет один процесс, читают
+несколько, и каждый читатель видит все записи. Заголовок буфера — счётчики
+uint64: вместимость, число читателей, позиция записи, признак завершения
+и позиция каждого читателя. Счётчики меняются только под общим условием
+(`multiprocessing.Condition`), сами записи копируются и читаются без
+блокировки: писатель публикует часть целиком, сдвигая свою позицию, а
+место освобождается, когда его прочитали все читатели. Читатель получает
+`memoryview` прямо на общую память, поэтому ничего не копирует и не
+распаковывает pickle.
+"""
+import multiprocessing
+import os
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from homework import TRAINING_TYPES, InfoMessage
+from wire import WIRE_CODES
+
+CAPACITY = 65536
+# Код тренировки, выравнивание до 8 байт и поля сообщения.
+RECORD = struct.Struct('<B7x4d')
+RECORD_FIELDS = ('duration', 'distance', 'speed', 'calories')
+# Заголовок: вместимость, читатели, запись, завершение, позиции читателей.
+_CAPACITY, _CONSUMERS, _WRITE, _CLOSED, _READ = range(5)
+_CODES: Dict[str, int] = {
+    TRAINING_TYPES[workout_type].training_class.__name__: code
+    for workout_type, code in WIRE_CODES.items()}
+_NAMES: Dict[int, str] = {code: name for name, code in _CODES.items()}
+
+
+def record_columns(view: memoryview) -> Dict[str, memoryview]:
+    """Колонки записей как `memoryview` с шагом, без копирования.
+
+    `training_type` — коды тренировок (uint8), остальные поля — float64.
+    Колонки ссылаются на общую память, поэтому их нужно отпустить до
+    следующей части и до `SharedRing.close()`.
+    """
+    doubles = view.cast('d')
+    step = RECORD.size // doubles.itemsize
+    columns = {'training_type': view[::RECORD.size]}
+    for index, name in enumerate(RECORD_FIELDS, start=1):
+        columns[name] = doubles[index::step]
+    return columns
+
+
+def unpack_messages(view: memoryview) -> Iterator[InfoMessage]:
+    """Собрать `InfoMessage` из записей буфера."""
+    for code, *values in RECORD.iter_unpack(view):
+        yield InfoMessage(_NAMES[code], *values)
+
+
+class SharedRing:
+    """Кольцо записей: один писатель и `consumers` читателей.
+
+    Объект передаётся дочерним процессам аргументом `Process`; там он
+    подключается к той же общей памяти. Удаляет память создавший объект
+    процесс в `close()`.
+    """
+
+    def __init__(self, capacity: int = CAPACITY, consumers: int = 1,
+                 context: Optional[Any] = None) -> None:
+        if capacity < 1:
+            raise ValueError('Вместимость должна быть положительной')
+        if consumers < 1:
+            raise ValueError('Нужен хотя бы один читатель')
+        context = context or multiprocessing.get_context()
+        header = (_READ + consumers) * 8
+        self._header_size = header
+        self._shm = SharedMemory(create=True,
+                                 size=header + capacity * RECORD.size)
+        # При fork объект не проходит через pickle, поэтому владельца
+        # отличаем по номеру процесса.
+        self._owner = os.getpid()
+        self._condition = context.Condition()
+        counters = self._shm.buf[:header].cast('Q')
+        counters[_CAPACITY] = capacity
+        counters[_CONSUMERS] = consumers
+        counters.release()
+        self._attach()
+
+    def _attach(self) -> None:
+        buffer = self._shm.buf
+        self._counters = buffer[:self._header_size].cast('Q')
+        self._records = buffer[self._header_size:]
+        self.capacity = self._counters[_CAPACITY]
+        self.consumers = self._counters[_CONSUMERS]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'name': self._shm.name, 'header_size': self._header_size,
+                'condition': self._condition}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._shm = SharedMemory(state['name'])
+        self._owner = None
+        self._header_size = state['header_size']
+        self._condition = state['condition']
+        self._attach()
+
+    def _free(self) -> int:
+        counters = self._counters
+        oldest = min(counters[_READ:_READ + self.consumers])
+        return self.capacity - (counters[_WRITE] - oldest)
+
+    def publish(self, messages: Iterable[InfoMessage]) -> int:
+        """Записать сообщения, дожидаясь места; вернуть их число."""
+        pack = RECORD.pack_into
+        records = self._records
+        size = RECORD.size
+        messages = iter(messages)
+        count = 0
+        while True:
+            with self._condition:
+                self._condition.wait_for(self._free)
+                position = self._counters[_WRITE]
+                free = self._free()
+            slot = position % self.capacity
+            limit = min(free, self.capacity - slot)
+            written = 0
+            for info in messages:
+                pack(records, (slot + written) * size,
+                     _CODES[info.training_type], info.duration,
+                     info.distance, info.speed, info.calories)
+                written += 1
+                if written == limit:
+                    break
+            if written:
+                with self._condition:
+                    self._counters[_WRITE] = position + written
+                    self._condition.notify_all()
+                count += written
+            if written < limit:
+                return count
+
+    def finish(self) -> None:
+        """Сообщить читателям, что новых записей не будет."""
+        with self._condition:
+            self._counters[_CLOSED] = 1
+            self._condition.notify_all()
+
+    def batches(self, consumer: int) -> Iterator[memoryview]:
+        """Выдавать читателю `consumer` непрочитанные записи частями.
+
+        Часть — непрерывный участок общей памяти. Место освобождается,
+        когда запрошена следующая часть, поэтому хранить `memoryview`
+        дольше нельзя.
+        """
+        if not 0 <= consumer < self.consumers:
+            raise ValueError(f'Нет читателя {consumer}')
+        counters = self._counters
+        cursor = _READ + consumer
+        size = RECORD.size
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: counters[_WRITE] > counters[cursor]
+                    or counters[_CLOSED])
+                position = counters[cursor]
+                available = counters[_WRITE] - position
+            if not available:
+                return
+            slot = position % self.capacity
+            count = min(available, self.capacity - slot)
+            view = self._records[slot * size:(slot + count) * size]
+            try:
+                yield view
+            finally:
+                view.release()
+            with self._condition:
+                counters[cursor] = position + count
+                self._condition.notify_all()
+
+    def messages(self, consumer: int) -> Iterator[InfoMessage]:
+        """Все записи читателя `consumer` в виде `InfoMessage`."""
+        for view in self.batches(consumer):
+            yield from unpack_messages(view)
+
+    def close(self) -> None:
+        """Отключиться от общей памяти; создатель её ещё и удаляет."""
+        self._counters.release()
+        self._records.release()
+        self._shm.close()
+        if self._owner == os.getpid():
+            self._shm.unlink()
+
+    def __enter__(self) -> 'SharedRing':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
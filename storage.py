@@ -0,0 +1,263 @@
+"""Колоночное хранилище рассчитанных тренировок.
+
+Каталог хранилища содержит по файлу на колонку: `type.u8` с кодами
+тренировок, `<колонка>.f64` с числами float64 в порядке байтов машины и
+`index_<КОД>.u64` с номерами строк каждого типа. Файлы только
+дописываются, а читаются через `mmap` без разбора.
+"""
+import mmap
+import os
+from array import array
+from bisect import bisect_left
+from typing import (Dict, Iterable, Iterator, List, Optional, Sequence,
+                    Tuple, Union)
+
+from batch import BATCH_COLUMNS
+from homework import TRAINING_TYPES, InfoMessage, read_package
+from wire import WIRE_CODES
+
+RESULT_COLUMNS = ('duration', 'distance', 'speed', 'calories')
+INPUT_COLUMNS = ('action', 'weight', 'height', 'length_pool', 'count_pool')
+FLOAT_COLUMNS = RESULT_COLUMNS + INPUT_COLUMNS
+TYPE_FILE = 'type.u8'
+_BY_CODE = {code: workout_type for workout_type, code in WIRE_CODES.items()}
+_MISSING = float('nan')
+
+Package = Tuple[str, Sequence[Union[int, float]]]
+
+
+def _float_file(name: str) -> str:
+    return f'{name}.f64'
+
+
+def _index_file(workout_type: str) -> str:
+    return f'index_{workout_type}.u64'
+
+
+def _row_values(workout_type: str, data: Sequence[Union[int, float]],
+                info: InfoMessage) -> Dict[str, float]:
+    """Значения всех колонок для одной тренировки."""
+    values = dict.fromkeys(INPUT_COLUMNS, _MISSING)
+    values.update(zip(BATCH_COLUMNS[workout_type], data))
+    values.update(duration=info.duration, distance=info.distance,
+                  speed=info.speed, calories=info.calories)
+    return values
+
+
+class HistoryStore:
+    """Дописываемое хранилище тренировок в каталоге `path`."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._rows = self._recover()
+        self._files = {name: open(self._file(name), 'ab')
+                       for name in self._file_names()}
+
+    def __enter__(self) -> 'HistoryStore':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    @staticmethod
+    def _file_names() -> List[str]:
+        return ([TYPE_FILE]
+                + [_float_file(name) for name in FLOAT_COLUMNS]
+                + [_index_file(workout_type) for workout_type in WIRE_CODES])
+
+    def _recover(self) -> int:
+        """Привести файлы к общей длине после прерванной записи.
+
+        Колонки обрезаются до общего числа строк, индексы — до целых
+        записей и существующих строк. Строки, которые успели попасть в
+        колонки, но не в индекс своего типа, дописываются в индекс.
+        """
+        sizes = {TYPE_FILE: 1}
+        sizes.update((_float_file(name), 8) for name in FLOAT_COLUMNS)
+        rows = min(os.path.getsize(self._file(name)) // size
+                   if os.path.exists(self._file(name)) else 0
+                   for name, size in sizes.items())
+        for name, size in sizes.items():
+            if os.path.exists(self._file(name)):
+                os.truncate(self._file(name), rows * size)
+        if not rows:
+            for workout_type in WIRE_CODES:
+                self._recover_index(workout_type, b'')
+            return rows
+        with open(self._file(TYPE_FILE), 'rb') as stream, \
+                mmap.mmap(stream.fileno(), 0,
+                          access=mmap.ACCESS_READ) as types:
+            for workout_type in WIRE_CODES:
+                self._recover_index(workout_type, types)
+        return rows
+
+    def _recover_index(self, workout_type: str,
+                       types: Union[bytes, mmap.mmap]) -> None:
+        """Сверить индекс типа с колонкой `type.u8` длины `len(types)`."""
+        path = self._file(_index_file(workout_type))
+        entries = array('Q')
+        if os.path.exists(path):
+            with open(path, 'rb') as stream:
+                data = stream.read()
+            entries.frombytes(data[:len(data) - len(data) % entries.itemsize])
+            del entries[bisect_left(entries, len(types)):]
+            if len(data) != len(entries) * entries.itemsize:
+                os.truncate(path, len(entries) * entries.itemsize)
+        code = bytes([WIRE_CODES[workout_type]])
+        missing = array('Q')
+        row = types.find(code, entries[-1] + 1 if entries else 0)
+        while row != -1:
+            missing.append(row)
+            row = types.find(code, row + 1)
+        if missing:
+            with open(path, 'ab') as stream:
+                missing.tofile(stream)
+
+    def append(self, workout_type: str,
+               data: Sequence[Union[int, float]],
+               info: Optional[InfoMessage] = None) -> int:
+        """Дописать одну тренировку, вернуть номер её строки."""
+        self.extend([(workout_type, data)],
+                    None if info is None else [info])
+        return self._rows - 1
+
+    def extend(self, packages: Iterable[Package],
+               messages: Optional[Iterable[InfoMessage]] = None) -> int:
+        """Дописать тренировки одним блоком на колонку.
+
+        Без `messages` показатели рассчитываются через `read_package`.
+        Возвращает число дописанных строк.
+        """
+        packages = list(packages)
+        if messages is None:
+            messages = [read_package(*package).show_training_info()
+                        for package in packages]
+        types = array('B')
+        columns = {name: array('d') for name in FLOAT_COLUMNS}
+        indexes: Dict[str, array] = {}
+        row = self._rows
+        for (workout_type, data), info in zip(packages, messages):
+            if workout_type not in WIRE_CODES:
+                raise ValueError('Неверный ключ')
+            types.append(WIRE_CODES[workout_type])
+            for name, value in _row_values(workout_type, data, info).items():
+                columns[name].append(value)
+            indexes.setdefault(workout_type, array('Q')).append(row)
+            row += 1
+        for name, column in columns.items():
+            column.tofile(self._files[_float_file(name)])
+        types.tofile(self._files[TYPE_FILE])
+        for workout_type, index in indexes.items():
+            index.tofile(self._files[_index_file(workout_type)])
+        self.flush()
+        added = row - self._rows
+        self._rows = row
+        return added
+
+    def flush(self) -> None:
+        """Сбросить буферы файлов на диск."""
+        for stream in self._files.values():
+            stream.flush()
+
+    def close(self) -> None:
+        """Закрыть файлы колонок."""
+        for stream in self._files.values():
+            stream.close()
+
+    def reader(self) -> 'HistoryReader':
+        """Открыть чтение текущего содержимого хранилища."""
+        self.flush()
+        return HistoryReader(self.path)
+
+
+class HistoryReader:
+    """Чтение хранилища через `mmap`: колонки — это `memoryview`.
+
+    Перед `close()` нужно освободить полученные срезы колонок.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._maps: List[mmap.mmap] = []
+        self._views: List[memoryview] = []
+        types = self._map(TYPE_FILE, 'B')
+        columns = {name: self._map(_float_file(name), 'd')
+                   for name in FLOAT_COLUMNS}
+        rows = min([len(types)] + [len(view) for view in columns.values()])
+        self.types = self._slice(types, rows)
+        self.columns = {name: self._slice(view, rows)
+                        for name, view in columns.items()}
+        self.indexes = {}
+        for workout_type in WIRE_CODES:
+            index = self._map(_index_file(workout_type), 'Q')
+            self.indexes[workout_type] = self._slice(
+                index, bisect_left(index, rows))
+
+    def __enter__(self) -> 'HistoryReader':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def _map(self, name: str, view_format: str) -> memoryview:
+        """Отобразить файл в память и вернуть типизированный вид."""
+        path = os.path.join(self.path, name)
+        if not os.path.exists(path) or not os.path.getsize(path):
+            return memoryview(b'').cast(view_format)
+        with open(path, 'rb') as stream:
+            mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        view = memoryview(mapped).cast(view_format)
+        self._views.append(view)
+        return view
+
+    def _slice(self, view: memoryview, stop: int) -> memoryview:
+        sliced = view[:stop]
+        self._views.append(sliced)
+        return sliced
+
+    def column(self, name: str, start: int = 0,
+               stop: Optional[int] = None) -> memoryview:
+        """Срез колонки `type` или одной из `FLOAT_COLUMNS` без копирования."""
+        if name == 'type':
+            return self.types[start:stop]
+        if name not in self.columns:
+            raise KeyError(f'Нет колонки {name}')
+        return self.columns[name][start:stop]
+
+    def rows_of_type(self, workout_type: str) -> memoryview:
+        """Номера строк с тренировками данного типа."""
+        if workout_type not in self.indexes:
+            raise ValueError('Неверный ключ')
+        return self.indexes[workout_type]
+
+    def message(self, row: int) -> InfoMessage:
+        """Собрать `InfoMessage` для строки."""
+        workout_type = _BY_CODE[self.types[row]]
+        training_class = TRAINING_TYPES[workout_type].training_class
+        return InfoMessage(training_class.__name__,
+                           *(self.columns[name][row]
+                             for name in RESULT_COLUMNS))
+
+    def messages(self, start: int = 0,
+                 stop: Optional[int] = None) -> Iterator[InfoMessage]:
+        """Сообщения для строк диапазона `[start, stop)`."""
+        for row in range(*slice(start, stop).indices(len(self))):
+            yield self.message(row)
+
+    def close(self) -> None:
+        """Освободить виды колонок и закрыть отображения."""
+        for view in reversed(self._views):
+            view.release()
+        for mapped in self._maps:
+            mapped.close()
@@ -0,0 +1,574 @@
+"""Детерминированный генератор синтетических пакетов датчиков.
+
+Поля пакетов берутся из настраиваемых распределений `WorkloadProfile`:
+число шагов и гребков выводится из длительности и темпа, поэтому пакеты
+правдоподобны. Заданная доля пакетов повторяет недавние (повторная
+отправка), ещё одна доля испорчена. Одинаковые профиль и зерно всегда
+дают одну и ту же последовательность.
+
+Пример: python synthetic.py 1000000 --format binary --output load.bin
+"""
+import argparse
+import random
+import sys
+from array import array
+from dataclasses import dataclass, field
+from itertools import islice
+from statistics import NormalDist
+from typing import (Any, BinaryIO, Callable, Dict, Iterator, List, Optional,
+                    Sequence, TextIO, Tuple, Union)
+
+from batch import BATCH_COLUMNS
+from wire import WIRE_CODES, WIRE_RECORDS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy необязателен
+    np = None
+
+Number = Union[int, float]
+Package = Tuple[str, List[Number]]
+
+DEFAULT_MIX: Dict[str, float] = {'RUN': 1.0, 'WLK': 1.0, 'SWM': 1.0}
+MALFORMED_KINDS = ('unknown_type', 'wrong_arity', 'zero_duration',
+                   'bad_number')
+# Виды порчи, которые можно записать в формате wire.
+BINARY_MALFORMED_KINDS = ('zero_duration',)
+RECENT_PACKAGES = 64
+BLOCK_SIZE = 4096
+# Пакетов в одном куске вывода; кратно BLOCK_SIZE.
+CHUNK_SIZE = 64 * BLOCK_SIZE
+# Заранее подготовленных текстов целых чисел для быстрой сборки строк.
+INT_TEXTS = 1 << 16
+MAX_INT_TEXTS = 1 << 22
+MINUTES_IN_HOUR = 60
+# Распределение задаётся таблицей из QUANTILES квантилей; случайное
+# 16-битное число выбирает ячейку таблицы, повторённой до INDEX_RANGE.
+QUANTILES = 4096
+INDEX_RANGE = 1 << 16
+# Случайных 16-битных чисел на пакет: решение о повторе или порче, тип,
+# длительность, вес, три поля типа и выбор повтора или вида порчи.
+DRAWS = 8
+# Типы numpy для полей записей wire.
+WIRE_DTYPES = {'B': '<u1', 'I': '<u4', 'd': '<f8'}
+# Столбцы случайных чисел для полей, которые берутся прямо из таблиц.
+DRAW_COLUMNS = {'duration': 2, 'weight': 3, 'height': 5, 'length_pool': 5}
+UNKNOWN_TYPE = 'XXX'
+# Текст длительности в испорченных пакетах.
+SPOILED_TEXT = {'zero_duration': b',0.0', 'bad_number': b',n/a'}
+# Таблица темпа, из которого выводится количество действий.
+RATE_TABLES = {'SWM': 'stroke_rate', 'RUN': 'run_cadence',
+               'WLK': 'walk_cadence'}
+
+
+class Uniform:
+    """Равномерное распределение с округлением до `digits` знаков."""
+
+    def __init__(self, low: float, high: float, digits: int = 3) -> None:
+        self.low = low
+        self.high = high
+        self.digits = digits
+
+    def quantile(self, p: float) -> Number:
+        return round(self.low + p * (self.high - self.low), self.digits)
+
+
+class Normal:
+    """Нормальное распределение, обрезанное до `[low, high]`.
+
+    Без `digits` значения округляются до целых.
+    """
+
+    def __init__(self, mean: float, sigma: float, low: float, high: float,
+                 digits: Optional[int] = None) -> None:
+        self.distribution = NormalDist(mean, sigma)
+        self.low = low
+        self.high = high
+        self.digits = digits
+
+    def quantile(self, p: float) -> Number:
+        value = self.distribution.inv_cdf(p)
+        return round(min(max(value, self.low), self.high), self.digits)
+
+
+class Choice:
+    """Равновероятный выбор одного из значений."""
+
+    def __init__(self, *values: Number) -> None:
+        self.values = values
+
+    def quantile(self, p: float) -> Number:
+        return self.values[int(p * len(self.values))]
+
+
+Distribution = Union[Uniform, Normal, Choice]
+
+
+def quantile_table(distribution: Distribution) -> List[Number]:
+    """Таблица квантилей, индексируемая 16-битным случайным числом."""
+    table = [distribution.quantile((index + 0.5) / QUANTILES)
+             for index in range(QUANTILES)]
+    return table * (INDEX_RANGE // QUANTILES)
+
+
+@dataclass
+class WorkloadProfile:
+    """Распределения полей пакетов и доли повторов и испорченных пакетов.
+
+    Темпы заданы в действиях (бассейнах) в минуту; количество действий
+    равно темпу, умноженному на длительность.
+    """
+
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    duration: Distribution = Normal(1.0, 0.4, 0.25, 3.0, digits=3)
+    weight: Distribution = Normal(75, 12, 40, 150, digits=1)
+    height: Distribution = Normal(172, 9, 140, 210)
+    run_cadence: Distribution = Normal(165, 10, 120, 200)
+    walk_cadence: Distribution = Normal(115, 10, 80, 150)
+    stroke_rate: Distribution = Normal(30, 5, 15, 50)
+    length_pool: Distribution = Choice(25, 50)
+    lap_rate: Distribution = Normal(1.2, 0.3, 0.3, 3.0, digits=2)
+    duplicate_rate: float = 0.0
+    malformed_rate: float = 0.0
+    malformed_kinds: Sequence[str] = MALFORMED_KINDS
+
+    def __post_init__(self) -> None:
+        if not any(self.mix.values()) or min(self.mix.values()) < 0:
+            raise ValueError('Доли типов должны быть неотрицательными, '
+                             'хотя бы одна — положительной')
+        unknown = set(self.mix) - set(DEFAULT_MIX)
+        if unknown:
+            raise ValueError(f'Неизвестный тип тренировки: {min(unknown)}')
+        if not 0 <= self.duplicate_rate + self.malformed_rate <= 1:
+            raise ValueError('Доли повторов и испорченных пакетов должны '
+                             'быть в [0, 1] в сумме')
+        unknown = set(self.malformed_kinds) - set(MALFORMED_KINDS)
+        if unknown:
+            raise ValueError(f'Неизвестный вид порчи: {min(unknown)}')
+
+    def type_table(self) -> List[str]:
+        """Таблица типов тренировок в пропорции `mix`."""
+        total = sum(self.mix.values())
+        bounds = []
+        share = 0.0
+        for workout_type, weight in self.mix.items():
+            share += weight / total
+            bounds.append((share, workout_type))
+        table = [next((workout_type for bound, workout_type in bounds
+                       if (index + 0.5) / QUANTILES < bound),
+                      bounds[-1][1])
+                 for index in range(QUANTILES)]
+        return table * (INDEX_RANGE // QUANTILES)
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Разобрать доли типов вида `RUN=2,WLK=1,SWM=1`."""
+    mix: Dict[str, float] = {}
+    for part in text.split(','):
+        workout_type, _, weight = part.partition('=')
+        workout_type = workout_type.strip().upper()
+        if workout_type not in DEFAULT_MIX:
+            raise ValueError(f'Неизвестный тип тренировки: {workout_type}')
+        mix[workout_type] = float(weight or 1)
+    if not any(mix.values()):
+        raise ValueError('Хотя бы одна доля должна быть положительной')
+    return mix
+
+
+class _Tables:
+    """Таблицы квантилей всех полей профиля."""
+
+    def __init__(self, profile: WorkloadProfile) -> None:
+        self.duration = quantile_table(profile.duration)
+        self.weight = quantile_table(profile.weight)
+        self.height = quantile_table(profile.height)
+        self.run_cadence = quantile_table(profile.run_cadence)
+        self.walk_cadence = quantile_table(profile.walk_cadence)
+        self.stroke_rate = quantile_table(profile.stroke_rate)
+        self.length_pool = quantile_table(profile.length_pool)
+        self.lap_rate = quantile_table(profile.lap_rate)
+
+
+def _actions(rate: Number, duration: float) -> int:
+    return max(1, round(rate * duration * MINUTES_IN_HOUR))
+
+
+def _running(tables: _Tables, duration: float, weight: float,
+             first: int, second: int, third: int) -> List[Number]:
+    return [_actions(tables.run_cadence[first], duration), duration,
+            weight]
+
+
+def _sports_walking(tables: _Tables, duration: float, weight: float,
+                    first: int, second: int, third: int) -> List[Number]:
+    return [_actions(tables.walk_cadence[first], duration), duration,
+            weight, tables.height[second]]
+
+
+def _swimming(tables: _Tables, duration: float, weight: float,
+              first: int, second: int, third: int) -> List[Number]:
+    return [_actions(tables.stroke_rate[first], duration), duration,
+            weight, tables.length_pool[second],
+            _actions(tables.lap_rate[third], duration)]
+
+
+BUILDERS: Dict[str, Callable[..., List[Number]]] = {
+    'SWM': _swimming,
+    'RUN': _running,
+    'WLK': _sports_walking,
+}
+
+
+def _spoil(kind: str, package: Package) -> Package:
+    """Испортить пакет способом `kind`."""
+    workout_type, data = package
+    if kind == 'unknown_type':
+        return UNKNOWN_TYPE, data
+    if kind == 'wrong_arity':
+        return workout_type, data[:-1]
+    if kind == 'zero_duration':
+        return workout_type, [data[0], 0.0, *data[2:]]
+    return workout_type, [data[0], 'n/a', *data[2:]]
+
+
+def _draws(rng: random.Random, count: int) -> array:
+    """`DRAWS` случайных 16-битных чисел на каждый из `count` пакетов."""
+    draws = array('H', rng.randbytes(2 * DRAWS * count))
+    if sys.byteorder == 'big':
+        draws.byteswap()
+    return draws
+
+
+class SyntheticWorkload:
+    """Источник синтетических пакетов с фиксированным зерном.
+
+    Повтор ссылается на один из `RECENT_PACKAGES` предыдущих пакетов того
+    же блока из `BLOCK_SIZE` пакетов, поэтому блоки независимы.
+    """
+
+    def __init__(self, profile: Optional[WorkloadProfile] = None,
+                 seed: int = 0) -> None:
+        self.profile = profile or WorkloadProfile()
+        self.seed = seed
+
+    def _limits(self) -> Tuple[int, int]:
+        """Границы 16-битного числа для повтора и для порчи пакета."""
+        profile = self.profile
+        return (round(profile.duplicate_rate * INDEX_RANGE),
+                round((profile.duplicate_rate + profile.malformed_rate)
+                      * INDEX_RANGE))
+
+    def _kinds(self, binary: bool) -> List[str]:
+        kinds = [kind for kind in self.profile.malformed_kinds
+                 if not binary or kind in BINARY_MALFORMED_KINDS]
+        if self.profile.malformed_rate and not kinds:
+            raise ValueError('Нет видов порчи для испорченных пакетов')
+        return kinds
+
+    def packages(self, count: int, binary: bool = False
+                 ) -> Iterator[Package]:
+        """Лениво выдать `count` пакетов; каждый вызов начинает заново.
+
+        С `binary=True` портятся только пакеты, которые можно записать в
+        формате wire (`BINARY_MALFORMED_KINDS`).
+        """
+        kinds = self._kinds(binary)
+        tables = _Tables(self.profile)
+        types = self.profile.type_table()
+        durations = tables.duration
+        weights = tables.weight
+        duplicates, specials = self._limits()
+        rng = random.Random(self.seed)
+        for start in range(0, count, BLOCK_SIZE):
+            draws = _draws(rng, min(BLOCK_SIZE, count - start))
+            history: List[Package] = []
+            for position, (roll, kind, duration, weight, first, second,
+                           third, pick) in enumerate(zip(
+                               *[draws[offset::DRAWS]
+                                 for offset in range(DRAWS)])):
+                source = position - 1 - pick % RECENT_PACKAGES
+                if roll < duplicates and source >= 0:
+                    package = history[source]
+                else:
+                    workout_type = types[kind]
+                    package = workout_type, BUILDERS[workout_type](
+                        tables, durations[duration], weights[weight],
+                        first, second, third)
+                    if duplicates <= roll < specials:
+                        package = _spoil(kinds[pick % len(kinds)], package)
+                history.append(package)
+                yield package
+
+    def lines(self, count: int) -> Iterator[str]:
+        """Лениво выдать пакеты строками вида `RUN,15000,1,75`."""
+        for workout_type, data in self.packages(count):
+            yield ','.join([workout_type, *map(str, data)]) + '\n'
+
+    def records(self, count: int) -> Iterator[bytes]:
+        """Лениво выдать пакеты записями формата wire."""
+        for workout_type, data in self.packages(count, binary=True):
+            yield WIRE_RECORDS[workout_type].pack(WIRE_CODES[workout_type],
+                                                  *data)
+
+    def _column_chunks(self, count: int,
+                       encode: Callable[[Any], bytes]) -> Iterator[bytes]:
+        """Передать `encode` случайные числа кусками по `CHUNK_SIZE`."""
+        rng = random.Random(self.seed)
+        for start in range(0, count, CHUNK_SIZE):
+            size = min(CHUNK_SIZE, count - start)
+            draws = np.frombuffer(rng.randbytes(2 * DRAWS * size), '<u2')
+            yield encode(draws.reshape(size, DRAWS))
+
+    def chunks(self, count: int) -> Iterator[bytes]:
+        """Выдать записи wire кусками по `CHUNK_SIZE` пакетов.
+
+        С numpy записи собираются по колонкам и побайтно совпадают с
+        `records()`; без numpy куски склеиваются из `records()`.
+        """
+        if np is None:
+            yield from _joined(self.records(count), count, b'')
+            return
+        encoder = _ColumnEncoder(self.profile, self._kinds(binary=True),
+                                 *self._limits())
+        yield from self._column_chunks(count, encoder.binary)
+
+    def text_chunks(self, count: int) -> Iterator[str]:
+        """Выдать строки пакетов кусками по `CHUNK_SIZE` пакетов.
+
+        С numpy строки собираются по колонкам и посимвольно совпадают с
+        `lines()`; без numpy куски склеиваются из `lines()`.
+        """
+        if np is None:
+            yield from _joined(self.lines(count), count, '')
+            return
+        encoder = _ColumnEncoder(self.profile, self._kinds(binary=False),
+                                 *self._limits())
+        for chunk in self._column_chunks(count, encoder.text):
+            yield chunk.decode('ascii')
+
+    def write_text(self, stream: TextIO, count: int) -> int:
+        """Записать `count` строк пакетов; вернуть число символов."""
+        return sum(stream.write(chunk) for chunk in self.text_chunks(count))
+
+    def write_binary(self, stream: BinaryIO, count: int) -> int:
+        """Записать `count` записей wire; вернуть число байт."""
+        return sum(stream.write(chunk) for chunk in self.chunks(count))
+
+
+def _joined(items: Iterator, count: int, empty: Any) -> Iterator:
+    """Склеить элементы кусками по `CHUNK_SIZE`."""
+    for start in range(0, count, CHUNK_SIZE):
+        yield empty.join(islice(items, min(CHUNK_SIZE, count - start)))
+
+
+def _text_table(values: Sequence[Any]) -> Any:
+    """Матрица байтов `,значение` с дополнением нулями до общей ширины."""
+    texts = [f',{value}'.encode() for value in values]
+    width = max(map(len, [*SPOILED_TEXT.values(), *texts]))
+    return np.array(texts, dtype=f'S{width}').view(np.uint8).reshape(
+        len(texts), width)
+
+
+def _digits_text(values: Any) -> Any:
+    """Матрица байтов `,число` для целых до 10 знаков без таблицы."""
+    values = values[:, None]
+    powers = 10 ** np.arange(9, -1, -1)
+    digits = (values // powers % 10 + ord('0')).astype(np.uint8)
+    digits[(values < powers) & (powers > 1)] = 0
+    return np.hstack([np.full((len(values), 1), ord(','), np.uint8),
+                      digits])
+
+
+def _actions_array(rate: Any, duration: Any) -> Any:
+    """Векторный вариант `_actions` с тем же округлением."""
+    return np.maximum(1, np.rint(rate * duration * MINUTES_IN_HOUR))
+
+
+class _ColumnEncoder:
+    """Сборка пакетов из случайных чисел целыми массивами numpy.
+
+    Нулевой байт служит заполнителем: поля выравниваются им до общей
+    ширины, а в конце все нули выбрасываются одной маской.
+    """
+
+    def __init__(self, profile: WorkloadProfile, kinds: Sequence[str],
+                 duplicates: int, specials: int) -> None:
+        tables = vars(_Tables(profile))
+        self.tables = {name: np.asarray(values)
+                       for name, values in tables.items()}
+        self.texts = {
+            name: np.tile(_text_table(tables[name][:QUANTILES]),
+                          (INDEX_RANGE // QUANTILES, 1))
+            for name in DRAW_COLUMNS}
+        self.numbers = _text_table(range(INT_TEXTS))
+        self.codes = np.array([WIRE_CODES[workout_type]
+                               for workout_type in profile.type_table()],
+                              dtype=np.uint8)
+        self.kinds = np.array([MALFORMED_KINDS.index(kind)
+                               for kind in kinds], dtype=np.int8)
+        self.duplicates = duplicates
+        self.specials = specials
+        self.dtypes = {
+            workout_type: np.dtype(
+                [(f'f{index}', WIRE_DTYPES[char])
+                 for index, char in enumerate(record.format[1:])])
+            for workout_type, record in WIRE_RECORDS.items()}
+
+    def _sources(self, roll: Any, pick: Any) -> Tuple[Any, Any]:
+        """Номер исходного пакета для каждого пакета с учётом повторов."""
+        index = np.arange(len(roll))
+        source = index - 1 - pick % RECENT_PACKAGES
+        duplicate = ((roll < self.duplicates)
+                     & (source >= index - index % BLOCK_SIZE))
+        source = np.where(duplicate, source, index)
+        # Повтор повтора ссылается на исходный пакет.
+        nested = np.flatnonzero(duplicate)
+        nested = nested[duplicate[source[nested]]]
+        while nested.size:
+            source[nested] = source[source[nested]]
+            nested = nested[duplicate[source[nested]]]
+        return duplicate, source
+
+    def _plan(self, draws: Any) -> Tuple[Any, Any, Any]:
+        """Случайные числа исходных пакетов, коды типов и виды порчи.
+
+        Вид порчи — номер в `MALFORMED_KINDS` или -1 для целого пакета.
+        """
+        roll = draws[:, 0]
+        pick = draws[:, 7].astype(np.int64)
+        duplicate, source = self._sources(roll, pick)
+        spoil = np.full(len(roll), -1, dtype=np.int8)
+        if len(self.kinds):
+            spoiled = (~duplicate & (roll >= self.duplicates)
+                       & (roll < self.specials))
+            spoil[spoiled] = self.kinds[pick[spoiled] % len(self.kinds)]
+        draws = draws[source]
+        return draws, self.codes[draws[:, 1]], spoil[source]
+
+    def _values(self, workout_type: str, draws: Any) -> Dict[str, Any]:
+        """Числовые поля `BATCH_COLUMNS` для пакетов одного типа."""
+        tables = self.tables
+        fields = BATCH_COLUMNS[workout_type]
+        values = {name: tables[name][draws[:, column]]
+                  for name, column in DRAW_COLUMNS.items()
+                  if name in fields}
+        duration = values['duration']
+        values['action'] = _actions_array(
+            tables[RATE_TABLES[workout_type]][draws[:, 4]], duration)
+        if 'count_pool' in fields:
+            values['count_pool'] = _actions_array(
+                tables['lap_rate'][draws[:, 6]], duration)
+        return values
+
+    def binary(self, draws: Any) -> bytes:
+        """Записи wire для массива случайных чисел формы `(n, DRAWS)`."""
+        draws, code, spoil = self._plan(draws)
+        zero = spoil == MALFORMED_KINDS.index('zero_duration')
+        width = max(record.size for record in WIRE_RECORDS.values())
+        sizes = np.zeros(len(code), dtype=np.int64)
+        output = np.empty((len(code), width), dtype=np.uint8)
+        for workout_type, fields in BATCH_COLUMNS.items():
+            rows = np.flatnonzero(code == WIRE_CODES[workout_type])
+            values = self._values(workout_type, draws[rows])
+            values['duration'][zero[rows]] = 0.0
+            records = np.empty(len(rows), dtype=self.dtypes[workout_type])
+            records['f0'] = WIRE_CODES[workout_type]
+            for index, name in enumerate(fields, start=1):
+                records[f'f{index}'] = values[name]
+            size = records.dtype.itemsize
+            output[rows, :size] = records.view(np.uint8).reshape(-1, size)
+            sizes[rows] = size
+        return output[np.arange(width) < sizes[:, None]].tobytes()
+
+    def _int_text(self, values: Any) -> Any:
+        """Матрица байтов `,число` для неотрицательных целых."""
+        values = values.astype(np.int64)
+        largest = int(values.max()) if len(values) else 0
+        if largest >= MAX_INT_TEXTS:
+            return _digits_text(values)
+        if largest >= len(self.numbers):
+            self.numbers = _text_table(range(largest + 1))
+        return self.numbers[values]
+
+    def _line(self, workout_type: str, draws: Any, spoil: Any) -> Any:
+        """Матрица байтов строк пакетов одного типа."""
+        values = self._values(workout_type, draws)
+        name = np.empty((len(draws), len(workout_type)), dtype=np.uint8)
+        name[:] = np.frombuffer(workout_type.encode(), dtype=np.uint8)
+        name[spoil == MALFORMED_KINDS.index('unknown_type')] = (
+            np.frombuffer(UNKNOWN_TYPE.encode(), dtype=np.uint8))
+        pieces = [name]
+        for field_name in BATCH_COLUMNS[workout_type]:
+            if field_name in DRAW_COLUMNS:
+                pieces.append(self.texts[field_name][
+                    draws[:, DRAW_COLUMNS[field_name]]])
+            else:
+                pieces.append(self._int_text(values[field_name]))
+        duration = pieces[2]
+        for kind, text in SPOILED_TEXT.items():
+            duration[spoil == MALFORMED_KINDS.index(kind)] = np.frombuffer(
+                text.ljust(duration.shape[1], b'\0'), dtype=np.uint8)
+        pieces[-1][spoil == MALFORMED_KINDS.index('wrong_arity')] = 0
+        pieces.append(np.full((len(draws), 1), ord('\n'), dtype=np.uint8))
+        return np.hstack(pieces)
+
+    def text(self, draws: Any) -> bytes:
+        """Строки пакетов для массива случайных чисел формы `(n, DRAWS)`."""
+        draws, code, spoil = self._plan(draws)
+        lines = {}
+        for workout_type in BATCH_COLUMNS:
+            rows = np.flatnonzero(code == WIRE_CODES[workout_type])
+            lines[workout_type] = rows, self._line(workout_type, draws[rows],
+                                                   spoil[rows])
+        width = max(line.shape[1] for _, line in lines.values())
+        output = np.zeros((len(code), width), dtype=np.uint8)
+        for rows, line in lines.values():
+            output[rows, :line.shape[1]] = line
+        return output[output != 0].tobytes()
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Разобрать аргументы командной строки."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('count', type=int, help='число пакетов')
+    parser.add_argument('--format', choices=('text', 'binary'),
+                        default='text', help='строки пакетов или формат wire')
+    parser.add_argument('--output', default='-',
+                        help='файл для записи, `-` — stdout')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help='доли типов, например RUN=2,WLK=1,SWM=1')
+    parser.add_argument('--duplicates', type=float, default=0.0,
+                        help='доля повторно отправленных пакетов')
+    parser.add_argument('--malformed', type=float, default=0.0,
+                        help='доля испорченных пакетов')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа; возвращает код завершения."""
+    args = parse_args(argv)
+    try:
+        profile = WorkloadProfile(mix=dict(args.mix),
+                                  duplicate_rate=args.duplicates,
+                                  malformed_rate=args.malformed)
+    except ValueError as error:
+        print(f'Ошибка: {error}', file=sys.stderr)
+        return 1
+    workload = SyntheticWorkload(profile, args.seed)
+    if args.format == 'text':
+        if args.output == '-':
+            workload.write_text(sys.stdout, args.count)
+        else:
+            with open(args.output, 'w', encoding='utf-8') as stream:
+                workload.write_text(stream, args.count)
+    elif args.output == '-':
+        workload.write_binary(sys.stdout.buffer, args.count)
+    else:
+        with open(args.output, 'wb') as stream:
+            workload.write_binary(stream, args.count)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,9 +2,36 @@ import sys
 from pathlib import Path
 from io import StringIO
 
+import pytest
+
 BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
 sys.path.append(str(BASE_DIR))
 
+SAMPLE_PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+def calculate_messages(packages):
+    """Messages that `read_package(...).show_training_info()` returns."""
+    from homework import read_package
+    return [read_package(*package).show_training_info()
+            for package in packages]
+
+
+@pytest.fixture
+def packages():
+    """One sample package per workout type."""
+    return [(code, list(data)) for code, data in SAMPLE_PACKAGES]
+
+
+@pytest.fixture
+def expected_messages(packages):
+    """Messages for the sample packages, computed by the classes."""
+    return calculate_messages(packages)
+
 
 class Capturing(list):
     """
@@ -0,0 +1,61 @@
+import pytest
+from conftest import calculate_messages
+
+import aggregation
+import batch
+
+RECORDS = [
+    ('anna', ('RUN', [15000, 1, 75])),
+    ('anna', ('RUN', [9000, 1, 75])),
+    ('anna', ('SWM', [720, 1, 80, 25, 40])),
+    ('boris', ('WLK', [9000, 1, 75, 180])),
+]
+
+
+def messages():
+    athletes, packages = zip(*RECORDS)
+    return list(zip(athletes, calculate_messages(packages)))
+
+
+def test_aggregator_totals():
+    aggregator = aggregation.Aggregator()
+    aggregator.add_many(messages())
+    running = aggregator.get('anna', 'Running')
+    assert running.sessions == 2
+    assert running.distance == 9.75 + 5.85
+    assert running.mean_speed == (9.75 + 5.85) / 2
+    assert running.calories == 699.75 + 383.85
+    assert aggregator.get('anna').sessions == 3
+    assert aggregator.get('boris', 'Running') == aggregation.Totals()
+    assert len(aggregator) == 3
+
+
+def test_aggregator_merge_matches_single_pass():
+    whole = aggregation.Aggregator()
+    whole.add_many(messages())
+    first, second = aggregation.Aggregator(), aggregation.Aggregator()
+    first.add_many(messages()[:2])
+    second.add_many(messages()[2:])
+    first.merge(second)
+    assert dict(first) == dict(whole)
+
+
+def test_aggregator_add_batch():
+    result = batch.calculate_batch('RUN', {
+        'action': [15000, 9000], 'duration': [1, 1], 'weight': [75, 75]})
+    aggregator = aggregation.Aggregator()
+    aggregator.add_batch(['anna', 'anna'], result)
+    expected = aggregation.Aggregator()
+    expected.add_many(messages()[:2])
+    assert dict(aggregator) == dict(expected)
+
+
+def test_aggregator_snapshot_roundtrip(tmp_path):
+    aggregator = aggregation.Aggregator()
+    aggregator.add_many(messages())
+    path = str(tmp_path / 'totals.json')
+    aggregator.save(path)
+    restored = aggregation.Aggregator.load(path)
+    assert dict(restored) == dict(aggregator)
+    with pytest.raises(ValueError):
+        aggregation.Aggregator.restore({'version': 0, 'totals': []})
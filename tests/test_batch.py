@@ -0,0 +1,130 @@
+import pytest
+
+import batch
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('SWM', [420, 4, 20, 42, 4]),
+    ('SWM', [1206, 12, 6, 12, 6]),
+    ('RUN', [15000, 1, 75]),
+    ('RUN', [420, 4, 20]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('WLK', [420, 4, 20, 42]),
+    ('WLK', [1206, 12, 6, 12]),
+]
+
+
+def test_calculate_batches_matches_training_methods():
+    results = batch.calculate_batches(batch.group_packages(PACKAGES))
+    messages = {code: list(result.messages())
+                for code, result in results.items()}
+    for workout_type, data in PACKAGES:
+        expected = homework.read_package(workout_type, data)
+        message = messages[workout_type].pop(0)
+        assert message == expected.show_training_info(), (
+            'Пакетный расчёт должен совпадать с методами классов '
+            f'для {workout_type} {data}'
+        )
+
+
+def test_calculate_batch_python_fallback(monkeypatch):
+    monkeypatch.setattr(batch, 'np', None)
+    result = batch.calculate_batch('WLK', {
+        'action': [9000], 'duration': [1], 'weight': [75], 'height': [180],
+    })
+    assert list(result.calories) == [157.50000000000003]
+    assert len(result) == 1
+
+
+def test_calculate_batch_empty():
+    result = batch.calculate_batch('RUN', {
+        'action': [], 'duration': [], 'weight': [],
+    })
+    assert len(result) == 0
+    assert list(result.messages()) == []
+
+
+@pytest.mark.parametrize('workout_type, columns', [
+    ('BOX', {'action': [1], 'duration': [1], 'weight': [1]}),
+    ('RUN', {'action': [1], 'duration': [1]}),
+    ('RUN', {'action': [1, 2], 'duration': [1], 'weight': [1]}),
+])
+def test_calculate_batch_invalid_columns(workout_type, columns):
+    with pytest.raises(ValueError):
+        batch.calculate_batch(workout_type, columns)
+
+
+def test_calculate_batch_zero_duration():
+    with pytest.raises(ZeroDivisionError):
+        batch.calculate_batch('RUN', {
+            'action': [1], 'duration': [0], 'weight': [1],
+        })
+
+
+@pytest.mark.parametrize('workout_type, data', [
+    ('RUN', [1, 0, 75]),
+    ('RUN', [0, 0, 75]),
+    ('RUN', [15000, 1e-320, 75]),
+    ('RUN', [15000, 1, 1e308]),
+    ('WLK', [1e300, 1, 75, 180]),
+    ('WLK', [9000, 1, 75, 0]),
+    ('WLK', [0, 1, 75, 0]),
+    ('SWM', [720, 1, 80, 1e308, 1e308]),
+])
+def test_calculate_batch_errors_match_python(monkeypatch, workout_type,
+                                             data):
+    columns = dict(zip(batch.BATCH_COLUMNS[workout_type], zip(data)))
+
+    def outcome():
+        try:
+            return list(batch.calculate_batch(workout_type, columns)
+                        .messages())
+        except ArithmeticError as error:
+            return type(error)
+
+    numpy_outcome = outcome()
+    monkeypatch.setattr(batch, 'np', None)
+    assert numpy_outcome == outcome()
+
+
+def test_training_columns_views_match_trainings():
+    columns = batch.TrainingColumns('SWM')
+    columns.extend(data for code, data in PACKAGES if code == 'SWM')
+    assert len(columns) == 3
+    for view, (_, data) in zip(columns, PACKAGES):
+        training = homework.read_package('SWM', data)
+        assert view.get_distance() == training.get_distance()
+        assert view.get_mean_speed() == training.get_mean_speed()
+        assert view.get_spent_calories() == training.get_spent_calories()
+        assert view.show_training_info() == training.show_training_info()
+    assert columns[-1].values() == (1206, 12, 6, 12, 6)
+    assert list(columns.calculate().messages()) == [
+        view.show_training_info() for view in columns]
+
+
+def test_training_columns_invalid_package():
+    columns = batch.TrainingColumns('RUN')
+    with pytest.raises(ValueError):
+        columns.append([1, 2])
+    with pytest.raises(IndexError):
+        columns[0]
+
+
+@pytest.mark.parametrize('numpy', [True, False])
+def test_invalid_rows(monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(batch, 'np', None)
+    columns = {
+        'action': [9000, 9000, 9000, float('nan'), 9000],
+        'duration': [1, 0, 1, 0, 0],
+        'weight': [75, 75, 75, 75, 75],
+        'height': [180, 180, 0, 180, 0],
+    }
+    assert batch.invalid_rows('WLK', columns) == {
+        1: 'zero_duration', 2: 'zero_height', 3: 'not_finite',
+        4: 'zero_duration'}
+    valid = batch.select_rows(columns, [0])
+    assert list(batch.calculate_batch('WLK', valid).calories) == [
+        157.50000000000003]
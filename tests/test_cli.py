@@ -0,0 +1,70 @@
+import io
+import subprocess
+import sys
+
+import pytest
+from conftest import BASE_DIR, Capturing
+
+import cli
+import wire
+
+
+@pytest.fixture
+def packages_text(packages):
+    return ''.join(','.join(map(str, (code, *data))) + '\n'
+                   for code, data in packages)
+
+
+@pytest.fixture
+def replies(expected_messages):
+    return [info.get_message() for info in expected_messages]
+
+
+def test_cli_text_from_stdin(monkeypatch, packages_text, replies):
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(packages_text))
+    with Capturing() as output:
+        assert cli.main([]) == 0
+    assert output == replies
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_cli_files(tmp_path, workers, packages_text, replies):
+    text = tmp_path / 'packages.txt'
+    text.write_text(packages_text, encoding='utf-8')
+    capture = str(tmp_path / 'packages.bin')
+    wire.write_capture(capture, [('RUN', [15000, 1, 75])])
+    with Capturing() as output:
+        assert cli.main([str(text), '--workers', str(workers)]) == 0
+        assert cli.main([capture, '--input-format', 'binary',
+                         '--format', 'csv']) == 0
+    assert output == replies + [
+        'training_type,duration,distance,speed,calories',
+        'Running,1.0,9.75,9.75,699.75']
+
+
+def test_cli_reports_bad_package(monkeypatch, capsys, replies):
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('BOX,1,1,1\n'))
+    assert cli.main([]) == 1
+    assert 'Ошибка: Неверный ключ' in capsys.readouterr().err
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(
+        'RUN,15000,1,75\nRUN,15000,1,75\nBOX,1,1,1\nRUN,15000,1,75\n'))
+    assert cli.main([]) == 1
+    assert capsys.readouterr().out.splitlines() == replies[1:2] * 2
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('WLK,1e300,1,75,180\n'))
+    assert cli.main([]) == 1
+    assert capsys.readouterr().err.startswith('Ошибка: ')
+
+
+def test_cli_startup_skips_optional_modules(packages_text, replies):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', 'cli.py'],
+        input=packages_text.encode(), cwd=str(BASE_DIR), check=True,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    imported = {line.rsplit('|', 1)[-1].strip()
+                for line in result.stderr.decode().splitlines()}
+    assert result.stdout.decode().splitlines() == replies
+    for module in ('numpy', 'batch', 'parallel', 'concurrent.futures',
+                   'asyncio', 'server', 'storage', 'wire', 'mmap',
+                   'csv', 'json'):
+        assert module not in imported, (
+            f'Модуль {module} не должен загружаться при простом запуске')
@@ -1,4 +1,10 @@
+import copy
+import gc
+import pickle
 import re
+import weakref
+from unittest import mock
+from fractions import Fraction
 import pytest
 import types
 import inspect
@@ -363,3 +369,202 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+@pytest.mark.parametrize('line, expected', [
+    ('SWM,720,1,80,25,40\n', ('SWM', [720, 1, 80, 25, 40])),
+    (' RUN, 15000, 1.5, 75 ', ('RUN', [15000, 1.5, 75])),
+])
+def test_parse_package(line, expected):
+    assert homework.parse_package(line) == expected
+
+
+def test_parse_package_invalid():
+    with pytest.raises(ValueError):
+        homework.parse_package('RUN,15000,x,75')
+
+
+def test_stream_reports():
+    lines = iter(['SWM,720,1,80,25,40\n', '\n', 'WLK,9000,1,75,180\n'])
+    reports = homework.stream_reports(lines)
+    assert isinstance(reports, types.GeneratorType)
+    assert list(reports) == [
+        'Тип тренировки: Swimming; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 0.994 км; '
+        'Ср. скорость: 1.000 км/ч; '
+        'Потрачено ккал: 336.000.',
+        'Тип тренировки: SportsWalking; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 5.850 км; '
+        'Ср. скорость: 5.850 км/ч; '
+        'Потрачено ккал: 157.500.',
+    ]
+
+
+def test_iter_lines(tmp_path):
+    path = tmp_path / 'packages.txt'
+    path.write_text('RUN,15000,1,75\n', encoding='utf-8')
+    messages = list(homework.stream_messages(homework.iter_lines(str(path))))
+    assert [info.training_type for info in messages] == ['Running']
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_metrics_cache_computes_once(input_data, monkeypatch):
+    training = homework.read_package(*input_data)
+    expected = training.show_training_info()
+    calls = []
+    for name in homework.Training.METRICS:
+        method = getattr(type(training), name)
+        monkeypatch.setattr(
+            type(training), name,
+            lambda self, method=method, name=name: (
+                calls.append(name) or method(self)))
+    training.enable_metrics_cache()
+    assert training.show_training_info() == expected
+    assert training.show_training_info() == expected
+    assert sorted(calls) == sorted(homework.Training.METRICS)
+
+
+def test_metrics_cache_invalidation():
+    training = homework.read_package('RUN', [15000, 1, 75])
+    training.enable_metrics_cache()
+    assert training.get_distance() == 9.75
+    training.action = 9000
+    assert training.get_distance() == 5.85
+    assert training.get_spent_calories() == 383.85
+    training.disable_metrics_cache()
+    assert 'get_distance' not in vars(training)
+    assert type(training) is homework.Running
+
+
+def test_metrics_cache_copies():
+    training = homework.read_package('RUN', [15000, 1, 75])
+    training.enable_metrics_cache()
+    assert training.get_distance() == 9.75
+    clone = copy.copy(training)
+    clone.action = 1000
+    assert clone.get_distance() == 0.65
+    assert clone.show_training_info().distance == 0.65
+    assert training.get_distance() == 9.75
+    for restored in (copy.deepcopy(training),
+                     pickle.loads(pickle.dumps(training))):
+        assert type(restored) is type(training)
+        assert restored.show_training_info() == training.show_training_info()
+    gc.disable()
+    try:
+        reference = weakref.ref(clone)
+        del clone
+        assert reference() is None
+    finally:
+        gc.enable()
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_read_package_fast_constructor(input_data):
+    workout_type, data = input_data
+    training = homework.read_package(workout_type, data)
+    expected = homework.TRAINING_TYPES[workout_type].training_class(*data)
+    assert type(training) is type(expected)
+    assert vars(training) == vars(expected)
+
+
+@pytest.mark.parametrize('input_data', [
+    ('RUN', [15000, 1]),
+    ('SWM', [720, 1, 80, 25]),
+    ('WLK', [9000, 1, 75, 180, 1]),
+])
+def test_read_package_wrong_arity(input_data):
+    with pytest.raises(ValueError, match='должен содержать'):
+        homework.read_package(*input_data)
+
+
+def test_register_training(monkeypatch):
+    monkeypatch.setattr(homework, 'TRAINING_TYPES',
+                        dict(homework.TRAINING_TYPES))
+
+    class Cycling(homework.Running):
+        LEN_STEP = 5.0
+
+    homework.register_training('CYC', Cycling)
+    training = homework.read_package('CYC', [1000, 1, 75])
+    assert isinstance(training, Cycling)
+    assert training.get_distance() == 5.0
+
+
+def test_kernel_matches_methods():
+    from benchmarks.workload import synthetic_backlog
+
+    for package in synthetic_backlog(3000, seed=7):
+        training = homework.read_package(*package)
+        expected = (training.get_distance(),
+                    training.get_mean_speed(),
+                    training.get_spent_calories())
+        assert type(training).KERNEL(*training.get_inputs()) == expected
+        assert training._metrics() == expected
+
+
+def test_kernel_for_subclasses():
+    class Cycling(homework.Running):
+        LEN_STEP = 5.0
+
+    class Rowing(homework.Running):
+        def get_spent_calories(self):
+            return 1.0
+
+    class Flat:
+        def get_spent_calories(self):
+            return 1.0
+
+    class FlatRun(Flat, homework.Running):
+        pass
+
+    class Trail(homework.Running):
+        LEN_STEP = Fraction(7, 10)
+
+    training = Cycling(1000, 2, 75)
+    assert Cycling.KERNEL(1000, 2, 75) == (5.0, 2.5, 225.0)
+    trail = Trail(15000, 1, 75)
+    assert trail.show_training_info().distance == Fraction(21, 2)
+    assert trail._metrics()[2] == trail.get_spent_calories()
+    assert training.show_training_info().distance == 5.0
+    assert homework.Training.KERNEL is None
+    assert Rowing.KERNEL is None
+    assert Rowing._metrics is homework.Training._metrics
+    assert Rowing(1000, 2, 75).show_training_info().calories == 1.0
+    assert FlatRun.KERNEL is None
+    assert FlatRun(15000, 1, 75).show_training_info().calories == 1.0
+
+
+def test_kernel_follows_class_changes(monkeypatch):
+    class Trail(homework.Running):
+        pass
+
+    training = Trail(15000, 1, 75)
+    with mock.patch.object(homework.Running, 'get_spent_calories',
+                           lambda self: 1.0):
+        assert homework.Running.KERNEL is None
+        assert training.show_training_info().calories == 1.0
+    assert training.show_training_info().calories != 1.0
+    assert Trail.KERNEL is not None
+
+    monkeypatch.setattr(homework.Running, 'LEN_STEP', 0.7)
+    assert training.show_training_info().distance == 10.5
+    assert homework.Running.KERNEL(15000, 1, 75)[0] == 10.5
+    monkeypatch.undo()
+    assert training.show_training_info().distance == 9.75
+
+    training.get_spent_calories = lambda: 1.0
+    assert training.show_training_info().calories == 1.0
+    del training.get_spent_calories
+    assert training._metrics() == (training.get_distance(),
+                                   training.get_mean_speed(),
+                                   training.get_spent_calories())
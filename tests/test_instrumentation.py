@@ -0,0 +1,56 @@
+import pytest
+from conftest import Capturing
+
+import homework
+import instrumentation
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('RUN', [9000, 1, 75]),
+]
+
+
+def run_main():
+    with Capturing():
+        for package in PACKAGES:
+            homework.main(homework.read_package(*package))
+
+
+def test_instrumentation_counts_and_histograms():
+    with instrumentation.Instrumentation() as hooks:
+        run_main()
+    assert homework._hooks is None
+    points = {(point['point'], point['workout_type']): point
+              for point in hooks.snapshot()['points']}
+    assert {workout_type for _, workout_type in points} == {'Running',
+                                                            'Swimming'}
+    for point in ('read_package', 'show_training_info', 'get_message',
+                  'main'):
+        assert points[point, 'Running']['count'] == 2
+        assert sum(points[point, 'Swimming']['histogram']) == 1
+    hooks.reset()
+    assert hooks.snapshot()['points'] == []
+
+
+def test_instrumentation_disabled_by_default():
+    hooks = instrumentation.Instrumentation()
+    run_main()
+    assert hooks.snapshot()['points'] == []
+
+
+@pytest.mark.parametrize('profiler, expected', [
+    ('cprofile', 'function calls'),
+    ('tracemalloc', 'size='),
+])
+def test_instrumentation_profile_window(profiler, expected):
+    with instrumentation.Instrumentation() as hooks:
+        hooks.profile(2, profiler)
+        run_main()
+        assert hooks.profile_report is not None
+        assert expected in hooks.profile_report
+        with pytest.raises(ValueError):
+            hooks.profile(1, 'perf')
+    with pytest.raises(RuntimeError):
+        hooks.profile(2, profiler)
+    assert hooks.profile_report is not None
@@ -0,0 +1,28 @@
+import pytest
+
+import parallel
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_process_packages_ordered(workers, packages, expected_messages):
+    result = list(parallel.process_packages(packages * 5,
+                                            workers=workers,
+                                            chunk_size=4))
+    assert result == expected_messages * 5
+
+
+def test_process_packages_unordered_formatted(packages, expected_messages):
+    result = parallel.process_packages(iter(packages * 5),
+                                       workers=2,
+                                       chunk_size=2,
+                                       ordered=False,
+                                       formatted=True)
+    assert sorted(result) == sorted(
+        info.get_message() for info in expected_messages * 5)
+
+
+def test_iter_chunks():
+    chunks = list(parallel.iter_chunks(range(5), 2))
+    assert chunks == [[0, 1], [2, 3], [4]]
+    with pytest.raises(ValueError):
+        list(parallel.iter_chunks(range(5), 0))
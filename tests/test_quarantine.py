@@ -0,0 +1,120 @@
+import json
+
+import pytest
+
+import batch
+import homework
+import quarantine
+import wire
+
+LINES = [
+    'SWM,720,1,80,25,40',
+    'BOX,1,2,3',
+    'RUN,15000,1,75',
+    'RUN,15000,0,75',
+    '',
+    'WLK,9000,1,75,180',
+    'WLK,9000,1,75,0',
+    'RUN,15000,1',
+    'SWM,720,x,80,25,40',
+    'RUN,15000,inf,75',
+    'WLK,420,4,20,42',
+]
+EXPECTED_REASONS = ['unknown_type', 'zero_duration', 'zero_height',
+                    'wrong_arity', 'bad_number', 'not_finite']
+
+
+def expected_messages():
+    messages = []
+    for line in LINES:
+        try:
+            training = homework.read_package(*homework.parse_package(line))
+            info = training.show_training_info()
+        except (ValueError, TypeError, ZeroDivisionError, IndexError):
+            continue
+        if 'inf' not in line:
+            messages.append(info.get_message())
+    return messages
+
+
+def run(tmp_path, **options):
+    source = tmp_path / 'in.txt'
+    source.write_text('\n'.join(LINES) + '\n', encoding='utf-8')
+    state = quarantine.process_file(str(source), str(tmp_path / 'out.txt'),
+                                    str(tmp_path / 'bad.jsonl'), **options)
+    output = (tmp_path / 'out.txt').read_text(encoding='utf-8')
+    rejected = [json.loads(line) for line in
+                (tmp_path / 'bad.jsonl').read_text(encoding='utf-8')
+                .splitlines()]
+    return state, output, rejected
+
+
+@pytest.mark.parametrize('numpy', [True, False])
+def test_process_file_quarantines_invalid_rows(tmp_path, monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(batch, 'np', None)
+    state, output, rejected = run(tmp_path, chunk_size=4)
+    assert output.splitlines() == expected_messages()
+    assert [entry['reason'] for entry in rejected] == EXPECTED_REASONS
+    assert rejected[0]['record'] == 'BOX,1,2,3'
+    assert state.processed == 4
+    assert state.quarantined == 6
+    assert state.offset == len('\n'.join(LINES)) + 1
+
+
+def test_process_file_resumes_after_crash(tmp_path, monkeypatch):
+    _, expected, expected_rejected = run(tmp_path)
+    checkpoint = str(tmp_path / 'run.ckpt')
+    read_text = quarantine.read_text
+
+    def crashing(path, offset=0):
+        for number, entry in enumerate(read_text(path, offset)):
+            if number == 5:
+                raise RuntimeError('сбой')
+            yield entry
+
+    monkeypatch.setitem(quarantine.READERS, 'text', crashing)
+    with pytest.raises(RuntimeError):
+        run(tmp_path, checkpoint_path=checkpoint, chunk_size=2)
+    state = quarantine.Checkpoint.load(checkpoint)
+    assert 0 < state.offset < len('\n'.join(LINES))
+    with open(tmp_path / 'out.txt', 'a', encoding='utf-8') as stream:
+        stream.write('недописанная строка')
+    monkeypatch.setitem(quarantine.READERS, 'text', read_text)
+    state, output, rejected = run(tmp_path, checkpoint_path=checkpoint,
+                                  chunk_size=2)
+    assert output == expected
+    assert rejected == expected_rejected
+    assert state.processed == 4
+    assert state.quarantined == 6
+
+
+def test_process_file_wire(tmp_path):
+    source = tmp_path / 'in.bin'
+    records = wire.encode_packages([('RUN', [15000, 1, 75]),
+                                    ('WLK', [9000, 0, 75, 180]),
+                                    ('SWM', [720, 1, 80, 25, 40])])
+    source.write_bytes(records + b'\x07garbage')
+    state = quarantine.process_file(str(source), str(tmp_path / 'out.csv'),
+                                    str(tmp_path / 'bad.jsonl'),
+                                    input_format='binary',
+                                    output_format='csv')
+    output = (tmp_path / 'out.csv').read_text(encoding='utf-8').splitlines()
+    assert output[0] == ','.join(quarantine.FIELDS)
+    assert [line.split(',')[0] for line in output[1:]] == ['Running',
+                                                           'Swimming']
+    assert state.reasons == {'zero_duration': 1, 'bad_record': 1}
+    assert state.offset == len(records) + 8
+    rejected = [json.loads(line) for line in
+                (tmp_path / 'bad.jsonl').read_text().splitlines()]
+    walk = wire.encode_package('WLK', [9000, 0, 75, 180])
+    assert rejected[0] == {'offset': 21, 'reason': 'zero_duration',
+                           'record': walk.hex()}
+    assert rejected[1]['record'] == b'\x07garbage'.hex()
+
+
+def test_process_file_checkpoint_ahead_of_output(tmp_path):
+    checkpoint = tmp_path / 'run.ckpt'
+    quarantine.Checkpoint(offset=1, output_size=100).save(str(checkpoint))
+    with pytest.raises(ValueError, match='короче'):
+        run(tmp_path, checkpoint_path=str(checkpoint))
@@ -0,0 +1,91 @@
+import io
+import json
+
+import pytest
+from conftest import Capturing
+
+import homework
+import report
+
+
+@pytest.mark.parametrize('block_size', [1, 2, 4096])
+def test_write_reports_text_matches_main(block_size, packages,
+                                         expected_messages):
+    with Capturing() as expected:
+        for package in packages:
+            homework.main(homework.read_package(*package))
+    buffer = io.StringIO()
+    count = report.write_reports(expected_messages, buffer,
+                                 block_size=block_size)
+    assert count == 3
+    assert buffer.getvalue() == '\n'.join(expected) + '\n'
+
+
+def test_write_reports_csv(expected_messages):
+    buffer = io.StringIO()
+    report.write_reports(expected_messages, buffer, 'csv')
+    lines = buffer.getvalue().splitlines()
+    assert lines[0] == 'training_type,duration,distance,speed,calories'
+    assert lines[1] == 'Swimming,1,0.9935999999999999,1.0,336.0'
+    assert len(lines) == 4
+
+
+def test_write_reports_jsonl(expected_messages):
+    buffer = io.StringIO()
+    report.write_reports(expected_messages, buffer, 'jsonl')
+    records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert records[1] == {'training_type': 'Running', 'duration': 1,
+                          'distance': 9.75, 'speed': 9.75,
+                          'calories': 699.75}
+
+
+def test_write_reports_unknown_format(expected_messages):
+    with pytest.raises(ValueError):
+        report.write_reports(expected_messages, io.StringIO(), 'xml')
+
+
+def test_text_templates_match_get_message():
+    from benchmarks.workload import synthetic_backlog
+
+    infos = [homework.read_package(*package).show_training_info()
+             for package in synthetic_backlog(2000, seed=3)]
+    infos += [
+        homework.InfoMessage('Running', 1, 0.0005, 2.0005, -0.0),
+        homework.InfoMessage('Swimming', float('nan'), float('inf'),
+                             -float('inf'), 1e20),
+        homework.InfoMessage('100% кардио', 0.1, 1.0625, 2.5e-4, 999.9995),
+    ]
+    expected = ''.join(info.get_message() + '\n' for info in infos)
+    assert report.RENDERERS['text'](infos) == expected
+    assert report.message_template('Running') is report.message_template(
+        'Running')
+
+
+@pytest.mark.parametrize('output_format', ['text', 'csv'])
+def test_write_reports_threads(output_format, expected_messages):
+    many = expected_messages * 1000
+    expected = io.StringIO()
+    report.write_reports(many, expected, output_format)
+    buffer = io.StringIO()
+    count = report.write_reports(iter(many), buffer, output_format,
+                                 block_size=7, workers=4)
+    assert count == 3000
+    assert buffer.getvalue() == expected.getvalue()
+    with pytest.raises(ValueError):
+        report.write_reports(many, buffer, output_format, workers=0)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+@pytest.mark.parametrize('block_size', [1, 2, 4096])
+def test_write_reports_keeps_messages_before_error(block_size, workers,
+                                                   expected_messages):
+    def messages():
+        yield from expected_messages[:2]
+        raise ValueError('Неверный ключ')
+
+    buffer = io.StringIO()
+    with pytest.raises(ValueError):
+        report.write_reports(messages(), buffer, block_size=block_size,
+                             workers=workers)
+    assert buffer.getvalue().splitlines() == [
+        info.get_message() for info in expected_messages[:2]]
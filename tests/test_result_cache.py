@@ -0,0 +1,39 @@
+import pytest
+
+import homework
+import result_cache
+
+
+def test_package_cache_hits_skip_read_package(monkeypatch, packages):
+    _, run, _ = packages
+    cache = result_cache.PackageCache()
+    expected = homework.read_package(*run).show_training_info()
+    assert cache.get_message(*run) == expected
+    monkeypatch.setattr(result_cache, 'read_package', None)
+    assert cache.get_message('RUN', (15000, 1, 75)) is cache.get_message(
+        *run)
+    assert cache.stats() == {'size': 1, 'maxsize': 65536,
+                             'hits': 2, 'misses': 1, 'evictions': 0}
+
+
+def test_package_cache_lru_eviction(packages):
+    swm, run, wlk = packages
+    cache = result_cache.PackageCache(maxsize=2)
+    messages = list(cache.process([swm, run, swm, wlk, swm]))
+    assert [info.training_type for info in messages] == [
+        'Swimming', 'Running', 'Swimming', 'SportsWalking', 'Swimming']
+    assert cache.stats()['evictions'] == 1
+    cache.get_message(*run)
+    assert cache.stats() == {'size': 2, 'maxsize': 2,
+                             'hits': 2, 'misses': 4, 'evictions': 2}
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()['hits'] == 0
+
+
+def test_package_cache_errors_are_not_cached():
+    cache = result_cache.PackageCache()
+    with pytest.raises(ValueError):
+        cache.get_message('BOX', [1, 1, 1])
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        result_cache.PackageCache(maxsize=0)
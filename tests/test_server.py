@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+import server
+import wire
+
+
+@pytest.fixture
+def replies(expected_messages):
+    return [info.get_message() for info in expected_messages]
+
+
+def run_with_server(framing, payloads, unix_path=None, read_size=16):
+    async def scenario():
+        ingest = server.IngestServer(framing, read_size=read_size)
+        if unix_path:
+            started = await ingest.start_unix(unix_path)
+            kwargs = {'path': unix_path}
+        else:
+            started = await ingest.start_tcp()
+            kwargs = {'port': started.sockets[0].getsockname()[1]}
+        async with started:
+            results = await asyncio.gather(*(
+                server.query(payload, **kwargs) for payload in payloads))
+        return ingest, results
+    return asyncio.run(scenario())
+
+
+def test_line_framing_concurrent_clients(replies):
+    payload = b'SWM,720,1,80,25,40\nRUN,15000,1,75\n\nWLK,9000,1,75,180'
+    ingest, results = run_with_server('line', [payload] * 5)
+    assert results == [replies] * 5
+    assert ingest.packages == 15
+    assert ingest.connections == 0
+
+
+def test_line_framing_reports_errors(replies):
+    payload = (b'RUN,15000,x,75\nBOX,1,1,1\nRUN,1,0,75\nRUN,15000,1,75\n'
+               b'WLK,1e300,1,75,180\n')
+    _, [result] = run_with_server('line', [payload])
+    assert [line.startswith('Ошибка: ') for line in result] == [
+        True, True, True, False, True]
+    assert result[-2] == replies[1]
+
+
+def test_binary_framing_unix_socket(tmp_path, packages, replies):
+    payload = wire.encode_packages(packages)
+    _, [result] = run_with_server('binary', [payload],
+                                  unix_path=str(tmp_path / 'ingest.sock'))
+    assert result == replies
+
+
+def test_binary_framing_truncated_record(packages, replies):
+    payload = wire.encode_packages(packages)[:-1]
+    _, [result] = run_with_server('binary', [payload])
+    assert result == replies[:2] + ['Ошибка: обрезанная запись']
+
+
+@pytest.mark.parametrize('read_size', [16, server.READ_SIZE])
+def test_binary_framing_unknown_code(packages, replies, read_size):
+    payload = wire.encode_packages(packages)
+    bad = payload + b'\xff' + payload
+    ingest, [result] = run_with_server('binary', [bad], read_size=read_size)
+    assert result[:3] == replies
+    assert result[3].startswith('Ошибка: Неверный код тренировки 255')
+    assert ingest.packages == 3
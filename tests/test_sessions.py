@@ -0,0 +1,45 @@
+import pytest
+
+import homework
+import sessions
+
+
+@pytest.mark.parametrize('package, options', [
+    (('RUN', [15000, 1, 75]), {}),
+    (('WLK', [9000, 1, 75, 180]), {'height': 180}),
+    (('SWM', [720, 1, 80, 25, 40]), {'length_pool': 25}),
+])
+def test_session_matches_read_package(package, options):
+    workout_type, data = package
+    session = sessions.SessionAccumulator(workout_type, data[2],
+                                          started_at=100, **options)
+    laps = {'laps': 20} if workout_type == 'SWM' else {}
+    session.add_sample(1900, data[0] // 2, **laps)
+    if workout_type == 'SWM':
+        laps = {'laps': data[4]}
+    session.add_sample(3700, data[0], **laps)
+    expected = homework.read_package(*package)
+    assert session.samples == 2
+    assert session.distance == expected.get_distance()
+    assert session.mean_speed == expected.get_mean_speed()
+    assert session.calories == expected.get_spent_calories()
+    assert session.finish() == expected.show_training_info()
+
+
+def test_session_rejects_invalid_samples():
+    session = sessions.SessionAccumulator('RUN', 75)
+    with pytest.raises(ValueError):
+        session.finish()
+    session.add_sample(10, 100)
+    with pytest.raises(ValueError):
+        session.add_sample(5, 200)
+    with pytest.raises(ValueError):
+        session.add_sample(20, 50)
+    with pytest.raises(ValueError):
+        session.add_sample(20, 200, laps=1)
+
+
+@pytest.mark.parametrize('workout_type', ['WLK', 'SWM', 'BOX'])
+def test_session_requires_type_parameters(workout_type):
+    with pytest.raises(ValueError):
+        sessions.SessionAccumulator(workout_type, 75)
@@ -0,0 +1,55 @@
+import multiprocessing
+
+import pytest
+
+import shared_ring
+
+
+def read_all(ring, consumer, results):
+    results.put(list(ring.messages(consumer)))
+    ring.close()
+
+
+def test_shared_ring_wraps_around(expected_messages):
+    expected = expected_messages
+    with shared_ring.SharedRing(capacity=4) as ring:
+        assert ring.publish(expected) == 3
+        ring.finish()
+        assert list(ring.messages(0)) == expected
+        assert ring.publish(expected[::-1]) == 3
+        views = ring.batches(0)
+        columns = {name: column.tolist() for name, column in
+                   shared_ring.record_columns(next(views)).items()}
+        assert columns['training_type'] == [2]
+        assert columns['calories'] == [expected[2].calories]
+        rest = [list(shared_ring.unpack_messages(view)) for view in views]
+        assert rest == [expected[1::-1]]
+
+
+def test_shared_ring_consumers_see_every_record(expected_messages):
+    context = multiprocessing.get_context()
+    expected = expected_messages * 20
+    results = context.SimpleQueue()
+    with shared_ring.SharedRing(capacity=7, consumers=2,
+                                context=context) as ring:
+        processes = [context.Process(target=read_all,
+                                     args=(ring, consumer, results))
+                     for consumer in range(2)]
+        for process in processes:
+            process.start()
+        assert ring.publish(iter(expected)) == len(expected)
+        ring.finish()
+        assert [results.get() for _ in processes] == [expected, expected]
+        for process in processes:
+            process.join()
+            assert process.exitcode == 0
+
+
+def test_shared_ring_invalid_arguments():
+    with pytest.raises(ValueError):
+        shared_ring.SharedRing(capacity=0)
+    with pytest.raises(ValueError):
+        shared_ring.SharedRing(consumers=0)
+    with shared_ring.SharedRing(capacity=1) as ring:
+        with pytest.raises(ValueError):
+            next(ring.batches(1))
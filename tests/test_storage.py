@@ -0,0 +1,78 @@
+import math
+import os
+
+import pytest
+from conftest import calculate_messages
+
+import homework
+import storage
+
+
+@pytest.fixture
+def history(packages):
+    return packages + [('RUN', [9000, 1, 75])]
+
+
+def test_history_store_roundtrip(tmp_path, history):
+    expected = calculate_messages(history)
+    with storage.HistoryStore(str(tmp_path)) as store:
+        assert store.extend(history[:3]) == 3
+        assert store.append(*history[3], expected[3]) == 3
+        with store.reader() as reader:
+            assert len(reader) == 4
+            assert list(reader.messages()) == expected
+            assert list(reader.messages(1, 3)) == expected[1:3]
+            assert list(reader.rows_of_type('RUN')) == [1, 3]
+            assert reader.column('distance', 1, 2).tolist() == [9.75]
+            assert reader.column('height')[2] == 180
+            assert math.isnan(reader.column('height')[1])
+            assert reader.column('type').tolist() == [3, 1, 2, 1]
+
+
+def test_history_store_reopen_and_recover(tmp_path, history,
+                                          expected_messages):
+    with storage.HistoryStore(str(tmp_path)) as store:
+        store.extend(history)
+    with open(tmp_path / 'calories.f64', 'ab') as stream:
+        stream.write(b'\0' * 8)
+    with open(tmp_path / 'type.u8', 'ab') as stream:
+        stream.write(b'\1')
+    with storage.HistoryStore(str(tmp_path)) as store:
+        assert len(store) == 4
+        store.extend(history[1:2])
+        with store.reader() as reader:
+            assert list(reader.rows_of_type('RUN')) == [1, 3, 4]
+            assert list(reader.messages())[-1] == expected_messages[1]
+
+
+def test_history_store_empty_and_invalid(tmp_path):
+    with storage.HistoryStore(str(tmp_path)) as store:
+        with store.reader() as reader:
+            assert len(reader) == 0
+            assert list(reader.messages()) == []
+            with pytest.raises(ValueError):
+                reader.rows_of_type('BOX')
+            with pytest.raises(KeyError):
+                reader.column('pace')
+        with pytest.raises(ValueError):
+            store.append('BOX', [1, 1, 1],
+                         homework.InfoMessage('Box', 1, 1, 1, 1))
+
+
+def test_history_store_recovers_indexes(tmp_path, history):
+    with storage.HistoryStore(str(tmp_path)) as store:
+        store.extend(history)
+    with open(tmp_path / 'index_RUN.u64', 'ab') as stream:
+        stream.write(b'\1\2\3')
+    with storage.HistoryStore(str(tmp_path)) as store:
+        with store.reader() as reader:
+            assert list(reader.rows_of_type('RUN')) == [1, 3]
+    # Сбой после записи колонок, но до записи индексов.
+    os.truncate(tmp_path / 'index_RUN.u64', 8)
+    os.truncate(tmp_path / 'index_WLK.u64', 0)
+    with storage.HistoryStore(str(tmp_path)) as store:
+        assert len(store) == 4
+        with store.reader() as reader:
+            assert list(reader.rows_of_type('RUN')) == [1, 3]
+            assert list(reader.rows_of_type('WLK')) == [2]
+            assert list(reader.rows_of_type('SWM')) == [0]
@@ -0,0 +1,99 @@
+import io
+from collections import Counter
+
+import pytest
+
+import homework
+import synthetic
+import wire
+
+
+def workload(seed=0, **options):
+    return synthetic.SyntheticWorkload(synthetic.WorkloadProfile(**options),
+                                       seed)
+
+
+def test_packages_are_deterministic():
+    first = list(workload(seed=3, duplicate_rate=0.1,
+                          malformed_rate=0.1).packages(5000))
+    again = list(workload(seed=3, duplicate_rate=0.1,
+                          malformed_rate=0.1).packages(5000))
+    other = list(workload(seed=4).packages(5000))
+    assert first == again
+    assert first != other
+
+
+def test_valid_packages_are_realistic():
+    counts = Counter()
+    for workout_type, data in workload(seed=1).packages(6000):
+        counts[workout_type] += 1
+        training = homework.read_package(workout_type, data)
+        info = training.show_training_info()
+        assert 0.25 <= info.duration <= 3
+        assert 0 < info.speed < 30
+    assert set(counts) == {'RUN', 'WLK', 'SWM'}
+    assert min(counts.values()) > 1500
+
+
+def test_duplicate_and_malformed_rates():
+    packages = list(workload(seed=2, duplicate_rate=0.2,
+                             malformed_rate=0.1).packages(20000))
+    failures = 0
+    for workout_type, data in packages:
+        try:
+            homework.read_package(workout_type, data).show_training_info()
+        except (ValueError, TypeError, ZeroDivisionError):
+            failures += 1
+    duplicates = len(packages) - len(set(map(repr, packages)))
+    assert 0.08 < failures / len(packages) < 0.14
+    assert 0.16 < duplicates / len(packages) < 0.24
+
+
+def test_text_round_trip():
+    generator = workload(seed=5, mix={'SWM': 1.0})
+    lines = list(generator.lines(100))
+    assert list(homework.read_packages(lines)) == list(
+        generator.packages(100))
+    stream = io.StringIO()
+    assert generator.write_text(stream, 100) == len(''.join(lines))
+    assert stream.getvalue() == ''.join(lines)
+
+
+def test_binary_round_trip():
+    generator = workload(seed=6, malformed_rate=0.5)
+    stream = io.BytesIO()
+    generator.write_binary(stream, 300)
+    decoded = list(wire.iter_records(stream.getvalue()))
+    expected = list(generator.packages(300, binary=True))
+    assert [(code, list(data)) for code, data in decoded] == expected
+    assert any(data[1] == 0 for _, data in decoded)
+
+
+def test_columns_match_python(monkeypatch):
+    pytest.importorskip('numpy')
+    generator = workload(seed=7, duplicate_rate=0.3, malformed_rate=0.2)
+    count = synthetic.BLOCK_SIZE * 2 + 17
+    assert ''.join(generator.text_chunks(count)) == ''.join(
+        generator.lines(count))
+    assert b''.join(generator.chunks(count)) == b''.join(
+        generator.records(count))
+    monkeypatch.setattr(synthetic, 'np', None)
+    assert b''.join(generator.chunks(count)) == b''.join(
+        generator.records(count))
+
+
+@pytest.mark.parametrize('options', [
+    {'mix': {'BOX': 1.0}},
+    {'mix': {'RUN': 0.0}},
+    {'duplicate_rate': 0.7, 'malformed_rate': 0.5},
+    {'malformed_kinds': ('broken',)},
+])
+def test_profile_invalid(options):
+    with pytest.raises(ValueError):
+        synthetic.WorkloadProfile(**options)
+
+
+def test_binary_requires_encodable_kinds():
+    generator = workload(malformed_rate=0.1, malformed_kinds=('wrong_arity',))
+    with pytest.raises(ValueError):
+        list(generator.records(10))
@@ -0,0 +1,47 @@
+import pytest
+
+import windows
+from homework import InfoMessage
+
+
+def message(training_type, distance, calories):
+    return InfoMessage(training_type, 1.0, distance, 1.0, calories)
+
+
+def test_sliding_window_expires_buckets():
+    window = windows.SlidingWindow(span=60, bucket=10)
+    window.add(0, 'anna', message('Running', 5.0, 100.0))
+    window.add(25, 'boris', message('Running', 3.0, 50.0))
+    window.add(55, 'anna', message('Swimming', 1.0, 30.0))
+    assert window.calories_by_type() == {'Running': 150.0, 'Swimming': 30.0}
+    assert window.top_athletes(1) == [('anna', 6.0)]
+    assert window.calories_by_type(now=65) == {'Running': 50.0,
+                                               'Swimming': 30.0}
+    assert window.top_athletes(2) == [('boris', 3.0), ('anna', 1.0)]
+    assert window.calories_by_type(now=1000) == {}
+    assert window.top_athletes(3) == []
+
+
+def test_sliding_window_late_messages():
+    window = windows.SlidingWindow(span=60, bucket=10)
+    window.add(100, 'anna', message('Running', 5.0, 100.0))
+    assert window.add(95, 'boris', message('Running', 1.0, 10.0))
+    assert not window.add(30, 'boris', message('Running', 1.0, 10.0))
+    assert window.dropped == 1
+    assert window.calories_by_type() == {'Running': 110.0}
+
+
+def test_windowed_metrics_spans():
+    metrics = windows.WindowedMetrics(spans=(300, 900), buckets=30)
+    for minute in range(20):
+        metrics.add(minute * 60, f'athlete{minute % 3}',
+                    message('Running', minute, 10.0))
+    assert metrics.calories(300) == 50.0
+    assert metrics.calories(900, 'Running') == 150.0
+    assert metrics.calories(900, 'Swimming') == 0.0
+    assert metrics.top_athletes(300, 1) == [('athlete1', 35.0)]
+
+
+def test_sliding_window_invalid_span():
+    with pytest.raises(ValueError):
+        windows.SlidingWindow(span=0)
@@ -0,0 +1,54 @@
+import pytest
+
+import homework
+import wire
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1.5, 75, 180]),
+]
+
+
+def test_iter_records_roundtrip():
+    buffer = memoryview(wire.encode_packages(PACKAGES))
+    records = list(wire.iter_records(buffer))
+    assert [(code, list(data)) for code, data in records] == PACKAGES
+
+
+def test_decode_trainings_and_columns_match_read_package():
+    buffer = wire.encode_packages(PACKAGES)
+    expected = [homework.read_package(*package).show_training_info()
+                for package in PACKAGES]
+    trainings = wire.decode_trainings(buffer)
+    assert [training.show_training_info() for training in trainings] == (
+        expected)
+    columns = wire.decode_columns(buffer)
+    assert sorted(columns) == ['RUN', 'SWM', 'WLK']
+    assert columns['WLK'][0].show_training_info() == expected[2]
+
+
+def test_capture_file(tmp_path):
+    path = str(tmp_path / 'capture.bin')
+    assert wire.write_capture(path, PACKAGES) == 3
+    assert [code for code, _ in wire.iter_capture(path)] == [
+        'SWM', 'RUN', 'WLK']
+    empty = str(tmp_path / 'empty.bin')
+    wire.write_capture(empty, [])
+    assert list(wire.iter_capture(empty)) == []
+
+
+@pytest.mark.parametrize('buffer', [
+    b'\x09' + bytes(20),
+    wire.encode_package('RUN', [1, 1, 1])[:-1],
+])
+def test_iter_records_invalid(buffer):
+    with pytest.raises(ValueError):
+        list(wire.iter_records(buffer))
+
+
+def test_encode_package_invalid():
+    with pytest.raises(ValueError):
+        wire.encode_package('BOX', [1, 1, 1])
+    with pytest.raises(ValueError):
+        wire.encode_package('RUN', [1, 1])
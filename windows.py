@@ -0,0 +1,147 @@
+"""Скользящие окна показателей по потоку сообщений о тренировках.
+
+Окно разбито на корзины фиксированной длины, хранящиеся по кругу. Сумма
+по окну поддерживается постоянно: новое сообщение прибавляется к своей
+корзине и к итогам окна, устаревшая корзина вычитается целиком. Поэтому
+обновление и устаревание стоят амортизированно O(1), а память окна
+ограничена числом корзин и числом активных спортсменов в нём.
+"""
+import heapq
+import math
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Optional, Sequence, Tuple
+
+from homework import InfoMessage
+
+DEFAULT_SPANS = (5 * 60, 15 * 60, 60 * 60)
+BUCKETS_PER_WINDOW = 60
+
+
+class _Bucket:
+    """Вклад сообщений одного интервала времени."""
+
+    __slots__ = ('slot', 'calories', 'sessions', 'distance', 'athletes')
+
+    def __init__(self, slot: int) -> None:
+        self.slot = slot
+        self.calories: DefaultDict[str, float] = defaultdict(float)
+        self.sessions: DefaultDict[str, int] = defaultdict(int)
+        self.distance: DefaultDict[str, float] = defaultdict(float)
+        self.athletes: DefaultDict[str, int] = defaultdict(int)
+
+
+class SlidingWindow:
+    """Калории по типам и дистанции спортсменов за последние `span` секунд."""
+
+    def __init__(self, span: float, bucket: Optional[float] = None) -> None:
+        if span <= 0:
+            raise ValueError('Длина окна должна быть положительной')
+        self.span = span
+        self.bucket = bucket or span / BUCKETS_PER_WINDOW
+        self.size = math.ceil(span / self.bucket)
+        self.head: Optional[int] = None
+        self.dropped = 0
+        self.calories: DefaultDict[str, float] = defaultdict(float)
+        self.sessions: DefaultDict[str, int] = defaultdict(int)
+        self.distance: DefaultDict[str, float] = defaultdict(float)
+        self._athletes: DefaultDict[str, int] = defaultdict(int)
+        self._ring: List[Optional[_Bucket]] = [None] * self.size
+
+    def _expire(self, position: int) -> None:
+        """Вычесть корзину из итогов окна и освободить её место."""
+        bucket = self._ring[position]
+        if bucket is None:
+            return
+        self._ring[position] = None
+        for workout_type, calories in bucket.calories.items():
+            self.sessions[workout_type] -= bucket.sessions[workout_type]
+            if self.sessions[workout_type]:
+                self.calories[workout_type] -= calories
+            else:
+                del self.sessions[workout_type], self.calories[workout_type]
+        for athlete, distance in bucket.distance.items():
+            self._athletes[athlete] -= bucket.athletes[athlete]
+            if self._athletes[athlete]:
+                self.distance[athlete] -= distance
+            else:
+                del self._athletes[athlete], self.distance[athlete]
+
+    def advance(self, now: float) -> None:
+        """Сдвинуть окно к моменту `now`, удалив устаревшие корзины."""
+        slot = int(now // self.bucket)
+        if self.head is None:
+            self.head = slot
+            return
+        if slot <= self.head:
+            return
+        if slot - self.head >= self.size:
+            for position in range(self.size):
+                self._expire(position)
+        else:
+            for passed in range(self.head + 1, slot + 1):
+                self._expire(passed % self.size)
+        self.head = slot
+
+    def add(self, timestamp: float, athlete: str, info: InfoMessage) -> bool:
+        """Учесть сообщение; вернуть `False`, если оно уже вне окна."""
+        self.advance(timestamp)
+        slot = int(timestamp // self.bucket)
+        if slot <= self.head - self.size:
+            self.dropped += 1
+            return False
+        position = slot % self.size
+        bucket = self._ring[position]
+        if bucket is None:
+            bucket = self._ring[position] = _Bucket(slot)
+        workout_type = info.training_type
+        bucket.calories[workout_type] += info.calories
+        bucket.sessions[workout_type] += 1
+        bucket.distance[athlete] += info.distance
+        bucket.athletes[athlete] += 1
+        self.calories[workout_type] += info.calories
+        self.sessions[workout_type] += 1
+        self.distance[athlete] += info.distance
+        self._athletes[athlete] += 1
+        return True
+
+    def calories_by_type(self, now: Optional[float] = None
+                         ) -> Dict[str, float]:
+        """Потраченные калории по типам тренировок за окно."""
+        if now is not None:
+            self.advance(now)
+        return dict(self.calories)
+
+    def top_athletes(self, k: int, now: Optional[float] = None
+                     ) -> List[Tuple[str, float]]:
+        """`k` спортсменов с наибольшей дистанцией за окно."""
+        if now is not None:
+            self.advance(now)
+        return heapq.nlargest(k, self.distance.items(),
+                              key=lambda item: item[1])
+
+
+class WindowedMetrics:
+    """Набор окон разной длины над одним потоком сообщений."""
+
+    def __init__(self, spans: Sequence[float] = DEFAULT_SPANS,
+                 buckets: int = BUCKETS_PER_WINDOW) -> None:
+        self.windows = {span: SlidingWindow(span, span / buckets)
+                        for span in spans}
+
+    def add(self, timestamp: float, athlete: str, info: InfoMessage) -> None:
+        """Учесть сообщение во всех окнах."""
+        for window in self.windows.values():
+            window.add(timestamp, athlete, info)
+
+    def calories(self, span: float, workout_type: Optional[str] = None,
+                 now: Optional[float] = None) -> float:
+        """Калории за окно по одному типу тренировки или по всем."""
+        totals = self.windows[span].calories_by_type(now)
+        if workout_type is not None:
+            return totals.get(workout_type, 0.0)
+        return sum(totals.values())
+
+    def top_athletes(self, span: float, k: int,
+                     now: Optional[float] = None) -> List[Tuple[str, float]]:
+        """`k` спортсменов с наибольшей дистанцией за окно."""
+        return self.windows[span].top_athletes(k, now)
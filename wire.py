@@ -0,0 +1,120 @@
+"""Двоичный формат пакетов датчиков.
+
+Запись — байт кода тренировки и поля пакета в порядке little-endian:
+количество действий (uint32), длительность, вес и рост (float64),
+длина бассейна и число бассейнов (uint32).
+"""
+import mmap
+import os
+import struct
+from typing import (TYPE_CHECKING, Dict, Iterable, Iterator, Sequence, Tuple,
+                    Union)
+
+from homework import Training, read_package
+
+if TYPE_CHECKING:
+    from batch import TrainingColumns
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+Package = Tuple[str, Tuple[Union[int, float], ...]]
+
+WIRE_CODES: Dict[str, int] = {'RUN': 1, 'WLK': 2, 'SWM': 3}
+WIRE_RECORDS: Dict[str, struct.Struct] = {
+    'RUN': struct.Struct('<BIdd'),
+    'WLK': struct.Struct('<BIddd'),
+    'SWM': struct.Struct('<BIddII'),
+}
+_BY_CODE: Dict[int, Tuple[str, struct.Struct]] = {
+    WIRE_CODES[workout_type]: (workout_type, record)
+    for workout_type, record in WIRE_RECORDS.items()}
+
+
+def encode_package(workout_type: str,
+                   data: Sequence[Union[int, float]]) -> bytes:
+    """Закодировать один пакет."""
+    if workout_type not in WIRE_RECORDS:
+        raise ValueError('Неверный ключ')
+    try:
+        return WIRE_RECORDS[workout_type].pack(WIRE_CODES[workout_type],
+                                               *data)
+    except struct.error as error:
+        raise ValueError(f'Некорректный пакет {workout_type}: '
+                         f'{error}') from None
+
+
+def encode_packages(packages: Iterable[Tuple[str, Sequence]]) -> bytes:
+    """Закодировать последовательность пакетов."""
+    return b''.join([encode_package(workout_type, data)
+                     for workout_type, data in packages])
+
+
+def write_capture(path: str, packages: Iterable[Tuple[str, Sequence]]) -> int:
+    """Записать пакеты в файл захвата, вернуть число записей."""
+    count = 0
+    with open(path, 'wb') as stream:
+        for workout_type, data in packages:
+            stream.write(encode_package(workout_type, data))
+            count += 1
+    return count
+
+
+def record_size(code: int) -> int:
+    """Размер записи с кодом тренировки `code` в байтах."""
+    if code not in _BY_CODE:
+        raise ValueError(f'Неверный код тренировки {code}')
+    return _BY_CODE[code][1].size
+
+
+def complete_size(buffer: Buffer) -> int:
+    """Длина начала буфера, состоящего только из целых записей."""
+    offset = 0
+    size = len(buffer)
+    while offset < size:
+        end = offset + record_size(buffer[offset])
+        if end > size:
+            break
+        offset = end
+    return offset
+
+
+def iter_records(buffer: Buffer) -> Iterator[Package]:
+    """Разобрать записи прямо из буфера, не копируя его."""
+    offset = 0
+    size = len(buffer)
+    while offset < size:
+        code = buffer[offset]
+        if code not in _BY_CODE:
+            raise ValueError(f'Неверный код тренировки {code} '
+                             f'по смещению {offset}')
+        workout_type, record = _BY_CODE[code]
+        if offset + record.size > size:
+            raise ValueError(f'Обрезанная запись {workout_type} '
+                             f'по смещению {offset}')
+        yield workout_type, record.unpack_from(buffer, offset)[1:]
+        offset += record.size
+
+
+def decode_trainings(buffer: Buffer) -> Iterator[Training]:
+    """Лениво создать тренировки из двоичных записей."""
+    for workout_type, data in iter_records(buffer):
+        yield read_package(workout_type, data)
+
+
+def decode_columns(buffer: Buffer) -> Dict[str, 'TrainingColumns']:
+    """Разложить двоичные записи по колонкам для каждого типа."""
+    from batch import TrainingColumns
+    batches: Dict[str, 'TrainingColumns'] = {}
+    for workout_type, data in iter_records(buffer):
+        if workout_type not in batches:
+            batches[workout_type] = TrainingColumns(workout_type)
+        batches[workout_type].append(data)
+    return batches
+
+
+def iter_capture(path: str) -> Iterator[Package]:
+    """Читать записи файла захвата через `mmap`."""
+    with open(path, 'rb') as stream:
+        if not os.fstat(stream.fileno()).st_size:
+            return
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            yield from iter_records(view)